@@ -2,9 +2,38 @@ import pygame as pg
 import numpy as np
 import math
 import sys
+from collections import OrderedDict
 
 def to_rad(deg): return deg * math.pi / 180.0
 
+# Rendered HUD text, reused until the string (or its color) changes
+class TextCache:
+    """LRU cache of rendered text keyed on (font, text, color, antialias)."""
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+        self.hits = self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Drop-in for font.render that reuses earlier results"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def hit_rate(self):
+        """Fraction of render calls served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
 class CubeManipulator:
     def __init__(self):
         pg.init()
@@ -53,6 +82,7 @@ class CubeManipulator:
         # Fonts
         self.font = pg.font.Font(None, 32)
         self.small_font = pg.font.Font(None, 28)
+        self.text_cache = TextCache()
 
     # --------------------------
     # Geometry (homogeneous)
@@ -351,7 +381,7 @@ class CubeManipulator:
                 y += 10
                 continue
             color = (255, 255, 0) if line.startswith(("Mode:", "FOV:", "Ortho")) else (255, 255, 255)
-            surf = self.small_font.render(line, True, color)
+            surf = self.text_cache.render(self.small_font, line, True, color)
             self.screen.blit(surf, (10, y))
             y += 25
 
@@ -361,17 +391,18 @@ class CubeManipulator:
         status = [
             f"Cube Position: ({pos[0]:.2f}, {pos[1]:.2f}, {pos[2]:.2f})",
             f"Cube Rotation: ({rot_deg[0]:.1f}°, {rot_deg[1]:.1f}°, {rot_deg[2]:.1f}°)",
+            f"Text cache hit rate: {self.text_cache.hit_rate():.0%}",
         ]
-        y = self.height - 80
+        y = self.height - 105
         for s in status:
-            surf = self.small_font.render(s, True, (200, 200, 255))
+            surf = self.text_cache.render(self.small_font, s, True, (200, 200, 255))
             self.screen.blit(surf, (10, y))
             y += 25
 
         # Mode indicator
         mode_text = "ROTATE" if (self.shift_held and self.mouse_grabbed) else "MOVE"
         mode_color = (255, 100, 100) if mode_text == "ROTATE" else (100, 255, 100)
-        mode_surface = self.font.render(mode_text, True, mode_color)
+        mode_surface = self.text_cache.render(self.font, mode_text, True, mode_color)
         rect = mode_surface.get_rect()
         rect.topright = (self.width - 20, 20)
         self.screen.blit(mode_surface, rect)
@@ -1,48 +1,105 @@
+import argparse
+import csv
+import functools
 import sys
 import time
 import math
+import queue
+import threading
+from collections import OrderedDict
+import numpy as np
 import pygame as pg
 
-# ---------------------------
-# Utility: safe pixel plotter
-# ---------------------------
-def set_px(surf, x, y, color):
-    if 0 <= x < surf.get_width() and 0 <= y < surf.get_height():
-        surf.set_at((x, y), color)
-
-# ---------------------------------
-# 8-way symmetry point plot helper
-# ---------------------------------
-def plot8(surf, cx, cy, x, y, color):
-    set_px(surf, cx + x, cy + y, color)
-    set_px(surf, cx - x, cy + y, color)
-    set_px(surf, cx + x, cy - y, color)
-    set_px(surf, cx - x, cy - y, color)
-    set_px(surf, cx + y, cy + x, color)
-    set_px(surf, cx - y, cy + x, color)
-    set_px(surf, cx + y, cy - x, color)
-    set_px(surf, cx - y, cy - x, color)
+# ------------------------------------------------------------
+# Arc clipping: the first-octant walk has a closed form, so each of
+# the eight mirrored octants maps to a window of steps that is on
+# the surface. Only those windows are walked.
+# ------------------------------------------------------------
+# Image of first-octant point (x, y) is (cx + sx * a, cy + sy * b),
+# with (a, b) = (y, x) when swapped, else (x, y)
+OCTANT_IMAGES = ((1, 1, False), (-1, 1, False), (1, -1, False), (-1, -1, False),
+                 (1, 1, True), (-1, 1, True), (1, -1, True), (-1, -1, True))
+
+def circle_y(r, x):
+    """y of the octant walk at step x: the largest y with x^2 + (y - 1/2)^2 < r^2."""
+    return (math.isqrt(4 * (r * r - x * x) - 1) + 1) // 2 if r else 0
+
+def last_step(r):
+    # Largest x with x <= circle_y(r, x), i.e. 4x^2 - 2x + 1 <= 2r^2
+    x = math.isqrt(2 * r * r) // 2
+    while x > 0 and 4 * x * x - 2 * x + 1 > 2 * r * r:
+        x -= 1
+    while 4 * (x + 1) ** 2 - 2 * (x + 1) + 1 <= 2 * r * r:
+        x += 1
+    return x
+
+def _last_step_with_y_at_least(r, low):
+    if low <= 0:
+        return r
+    n = 4 * r * r - 1 - (2 * low - 1) ** 2
+    return math.isqrt(n // 4) if n >= 0 else -1
+
+def _offset_range(c, s, size):
+    # Offsets o with 0 <= c + s * o < size
+    return (-c, size - 1 - c) if s > 0 else (c - (size - 1), c)
+
+def visible_arcs(cx, cy, r, width, height):
+    """Split the walk into (first_step, last_step, images) runs in which the
+    same octant images are on the surface. Steps and octants with nothing
+    visible are left out entirely.
+    """
+    end = last_step(r)
+    windows = []
+    for sx, sy, swap in OCTANT_IMAGES:
+        # One screen axis follows the step x, the other follows circle_y
+        if swap:
+            (k_lo, k_hi), (y_lo, y_hi) = _offset_range(cy, sy, height), _offset_range(cx, sx, width)
+        else:
+            (k_lo, k_hi), (y_lo, y_hi) = _offset_range(cx, sx, width), _offset_range(cy, sy, height)
+        k_lo = max(k_lo, 0, _last_step_with_y_at_least(r, y_hi + 1) + 1)
+        k_hi = min(k_hi, end, _last_step_with_y_at_least(r, y_lo))
+        if k_lo <= k_hi:
+            windows.append((k_lo, k_hi, (sx, sy, swap)))
+
+    bounds = sorted({lo for lo, _, _ in windows} | {hi + 1 for _, hi, _ in windows})
+    arcs = []
+    for first, stop in zip(bounds, bounds[1:]):
+        images = [img for lo, hi, img in windows if lo <= first <= hi]
+        if images:
+            arcs.append((first, stop - 1, images))
+    return arcs
+
+# Returns the number of distinct pixels written: on the axes (x == 0)
+# and the diagonals (x == y) the mirrored images coincide in pairs.
+def plot_images(surf, cx, cy, x, y, images, color):
+    pts = [(cx + sx * (y if swap else x), cy + sy * (x if swap else y)) for sx, sy, swap in images]
+    if x == 0 or x == y:
+        pts = set(pts)
+    for p in pts:
+        surf.set_at(p, color)
+    return len(pts)
 
 # ----------------------------------------
 # Midpoint Circle (integer arithmetic)
 # d0 = 1 - r; if d < 0 -> E step; else SE
 # ----------------------------------------
 def draw_circle_midpoint(surf, cx, cy, r, color):
-    x, y = 0, r
-    d = 1 - r
     plotted = 0
+    for first, last, images in visible_arcs(cx, cy, r, surf.get_width(), surf.get_height()):
+        # Enter the walk mid-way: d is F(x + 1, y - 1/2) - 1/4 at this step
+        x, y = first, circle_y(r, first)
+        d = (x + 1) ** 2 + y * y - y - r * r
 
-    while x <= y:
-        # plot 8-fold symmetric points
-        plot8(surf, cx, cy, x, y, color)
-        plotted += 8 if x != 0 and x != y else (4 if x == 0 or x == y else 8)
+        while x <= last:
+            # plot the visible symmetric points
+            plotted += plot_images(surf, cx, cy, x, y, images, color)
 
-        if d < 0:
-            d += 2 * x + 3           # move E
-        else:
-            d += 2 * (x - y) + 5     # move SE
-            y -= 1
-        x += 1
+            if d < 0:
+                d += 2 * x + 3           # move E
+            else:
+                d += 2 * (x - y) + 5     # move SE
+                y -= 1
+            x += 1
     return plotted
 
 # -----------------------------------------------------------
@@ -50,28 +107,415 @@ def draw_circle_midpoint(surf, cx, cy, r, color):
 # decision = 3 - 2r; if < 0 -> E; else SE
 # -----------------------------------------------------------
 def draw_circle_bresenham(surf, cx, cy, r, color):
-    x, y = 0, r
-    d = 3 - 2 * r
     plotted = 0
+    for first, last, images in visible_arcs(cx, cy, r, surf.get_width(), surf.get_height()):
+        # This decision variable is always 2 * (midpoint d) + 1
+        x, y = first, circle_y(r, first)
+        d = 2 * ((x + 1) ** 2 + y * y - y - r * r) + 1
+
+        while x <= last:
+            plotted += plot_images(surf, cx, cy, x, y, images, color)
+
+            if d < 0:
+                d += 4 * x + 6           # move E
+            else:
+                d += 4 * (x - y) + 10    # move SE
+                y -= 1
+            x += 1
+    return plotted
 
+# ------------------------------------------------------------
+# Vectorized mode: walk the first octant only, mirror it into all
+# eight with array ops, drop duplicates, write with one assignment
+# ------------------------------------------------------------
+def octant_midpoint(r):
+    xs, ys = [], []
+    x, y = 0, r
+    d = 1 - r
     while x <= y:
-        plot8(surf, cx, cy, x, y, color)
-        plotted += 8 if x != 0 and x != y else (4 if x == 0 or x == y else 8)
+        xs.append(x)
+        ys.append(y)
+        if d < 0:
+            d += 2 * x + 3
+        else:
+            d += 2 * (x - y) + 5
+            y -= 1
+        x += 1
+    return np.array(xs), np.array(ys)
 
+def octant_bresenham(r):
+    xs, ys = [], []
+    x, y = 0, r
+    d = 3 - 2 * r
+    while x <= y:
+        xs.append(x)
+        ys.append(y)
         if d < 0:
-            d += 4 * x + 6           # move E
+            d += 4 * x + 6
         else:
-            d += 4 * (x - y) + 10    # move SE
+            d += 4 * (x - y) + 10
             y -= 1
         x += 1
-    return plotted
+    return np.array(xs), np.array(ys)
+
+def mirror_octant(xs, ys, r):
+    """All eight symmetric copies of an octant, without repeated offsets."""
+    ox = np.concatenate([xs, -xs, xs, -xs, ys, -ys, ys, -ys])
+    oy = np.concatenate([ys, ys, -ys, -ys, xs, xs, -xs, -xs])
+    # Points on the axes and diagonals map onto each other; dedupe on a
+    # single integer key instead of (x, y) pairs
+    side = 2 * r + 1
+    key = np.unique((ox + r) * side + (oy + r))
+    return key // side - r, key % side - r
+
+def blit_offsets(surf, cx, cy, ox, oy, color):
+    """Write center + offsets in one surfarray assignment; returns pixels written."""
+    px = ox + cx
+    py = oy + cy
+    keep = (px >= 0) & (px < surf.get_width()) & (py >= 0) & (py < surf.get_height())
+    pixels = pg.surfarray.pixels2d(surf)
+    pixels[px[keep], py[keep]] = surf.map_rgb(color)
+    del pixels  # unlock the surface
+    return int(keep.sum())
+
+# ------------------------------------------------------------
+# Offset tables depend only on (algorithm, radius), so keep the
+# recently used ones in a byte-capped LRU cache
+# ------------------------------------------------------------
+OCTANTS = {"midpoint": octant_midpoint, "bresenham": octant_bresenham}
+
+class OffsetCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # (algorithm, r) -> (ox, oy), oldest first
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, r, algorithm):
+        key = (algorithm, r)
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        self.misses += 1
+        ox, oy = mirror_octant(*OCTANTS[algorithm](r), r)
+        offsets = (ox.astype(np.int32), oy.astype(np.int32))
+        size = offsets[0].nbytes + offsets[1].nbytes
+        if size <= self.max_bytes:
+            self.entries[key] = offsets
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (old_x, old_y) = self.entries.popitem(last=False)
+                self.nbytes -= old_x.nbytes + old_y.nbytes
+                self.evictions += 1
+        return offsets
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(self.entries), "bytes": self.nbytes, "hit_rate": self.hit_rate()}
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+
+offset_cache = OffsetCache()
+
+def _bbox_visible(surf, cx, cy, r):
+    return cx + r >= 0 and cy + r >= 0 and cx - r < surf.get_width() and cy - r < surf.get_height()
+
+def draw_circle_midpoint_vec(surf, cx, cy, r, color):
+    if not _bbox_visible(surf, cx, cy, r):
+        return 0
+    ox, oy = offset_cache.get(r, "midpoint")
+    return blit_offsets(surf, cx, cy, ox, oy, color)
+
+def draw_circle_bresenham_vec(surf, cx, cy, r, color):
+    if not _bbox_visible(surf, cx, cy, r):
+        return 0
+    ox, oy = offset_cache.get(r, "bresenham")
+    return blit_offsets(surf, cx, cy, ox, oy, color)
+
+# ------------------------------------------------------------
+# Batch outlines: cull by bounding box, share one offset table per
+# radius, then a single ordered surfarray write for all circles
+# ------------------------------------------------------------
+def draw_circles(surf, centers, radii, colors, algorithm="midpoint"):
+    """Draw many circle outlines at once; returns how many survived culling.
+
+    centers is (N, 2), radii (N,), colors either one RGB tuple or (N, 3).
+    Where circles overlap, later ones win, as with one-by-one drawing.
+    """
+    centers = np.asarray(centers, dtype=np.int64).reshape(-1, 2)
+    radii = np.asarray(radii, dtype=np.int64).reshape(-1)
+    cx, cy = centers[:, 0], centers[:, 1]
+    w, h = surf.get_size()
+    visible = np.flatnonzero((cx + radii >= 0) & (cy + radii >= 0) & (cx - radii < w) & (cy - radii < h))
+    if len(visible) == 0:
+        return 0
+
+    if isinstance(colors, tuple):
+        mapped = np.full(len(visible), surf.map_rgb(colors), dtype=np.uint32)
+    else:
+        colors = np.asarray(colors).reshape(-1, 3)[visible]
+        mapped = np.array([surf.map_rgb(c) for c in map(tuple, colors.tolist())], dtype=np.uint32)
+
+    # Lay the circles' pixels out in input order (each gets a slot sized by
+    # its radius' table) so the single write below keeps later-wins overlap
+    vis_r = radii[visible]
+    uniq, inverse = np.unique(vis_r, return_inverse=True)
+    tables = [offset_cache.get(r, algorithm) for r in uniq.tolist()]
+    counts = np.array([len(ox) for ox, _ in tables])[inverse]
+    start = np.cumsum(counts) - counts
+    px = np.empty(counts.sum(), dtype=np.int64)
+    py = np.empty_like(px)
+    values = np.empty(len(px), dtype=np.uint32)
+    for i, (ox, oy) in enumerate(tables):
+        sel = np.flatnonzero(inverse == i)
+        dest = (start[sel, None] + np.arange(len(ox))).ravel()
+        px[dest] = (cx[visible[sel], None] + ox).ravel()
+        py[dest] = (cy[visible[sel], None] + oy).ravel()
+        values[dest] = np.repeat(mapped[sel], len(ox))
+    keep = (px >= 0) & (px < w) & (py >= 0) & (py < h)
+
+    pixels = pg.surfarray.pixels2d(surf)
+    pixels[px[keep], py[keep]] = values[keep]
+    del pixels
+    return len(visible)
+
+# ------------------------------------------------------------
+# Filled discs and rings: the midpoint walk gives, for every row
+# offset dy, the half-width of the outline there, so each scanline
+# is a single Surface.fill span
+# ------------------------------------------------------------
+@functools.lru_cache(maxsize=256)
+def disc_half_widths(r):
+    """half[dy] = largest |x| of the midpoint outline on row dy, dy in 0..r."""
+    xs, ys = octant_midpoint(r)
+    half = np.zeros(r + 1, dtype=np.int64)
+    np.maximum.at(half, ys, xs)
+    np.maximum.at(half, xs, ys)
+    return half.tolist()
+
+def _visible_rows(cy, r, height):
+    return range(max(-r, -cy), min(r, height - 1 - cy) + 1)
+
+def fill_disc(surf, cx, cy, r, color):
+    """Filled disc, one fill per scanline; returns pixels written."""
+    half = disc_half_widths(r)
+    written = 0
+    for dy in _visible_rows(cy, r, surf.get_height()):
+        h = half[abs(dy)]
+        written += surf.fill(color, (cx - h, cy + dy, 2 * h + 1, 1)).width
+    return written
+
+def fill_ring(surf, cx, cy, r_inner, r_outer, color):
+    """Annulus: the r_outer disc minus the (r_inner - 1) disc, so both
+    outlines are included. At most two fills per scanline."""
+    if not 0 <= r_inner <= r_outer:
+        raise ValueError(f"need 0 <= r_inner <= r_outer, got {r_inner}, {r_outer}")
+    if r_inner == 0:
+        return fill_disc(surf, cx, cy, r_outer, color)
+    outer = disc_half_widths(r_outer)
+    hole = disc_half_widths(r_inner - 1)
+    written = 0
+    for dy in _visible_rows(cy, r_outer, surf.get_height()):
+        h = outer[abs(dy)]
+        if abs(dy) < r_inner:
+            gap = hole[abs(dy)] + 1
+            written += surf.fill(color, (cx - h, cy + dy, h - gap + 1, 1)).width
+            written += surf.fill(color, (cx + gap, cy + dy, h - gap + 1, 1)).width
+        else:
+            written += surf.fill(color, (cx - h, cy + dy, 2 * h + 1, 1)).width
+    return written
 
 # -------------------
 # Text rendering HUD
 # -------------------
+# Header and labels repeat every frame; only changed strings get rendered
+class TextCache:
+    """LRU cache of rendered text keyed on (font, text, color, antialias)."""
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+        self.hits = self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Drop-in for font.render that reuses earlier results"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def hit_rate(self):
+        """Fraction of render calls served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+text_cache = TextCache()
+
 def blit_text(screen, text, pos, font, color=(20, 20, 20)):
-    s = font.render(text, True, color)
-    screen.blit(s, pos)
+    s = text_cache.render(font, text, True, color)
+    return screen.blit(s, pos)
+
+# ---------------------------------------------------------------
+# Headless benchmark: every algorithm draws each radius many times
+# on an off-screen surface just big enough for the whole circle
+# ---------------------------------------------------------------
+CIRCLE_KERNELS = {
+    "midpoint": draw_circle_midpoint,
+    "bresenham": draw_circle_bresenham,
+    "midpoint_vec": draw_circle_midpoint_vec,
+    "bresenham_vec": draw_circle_bresenham_vec,
+    # Filled shapes; the pygame reference kernels return None (no exact count)
+    "disc_spans": fill_disc,
+    "pg_draw_disc": lambda surf, cx, cy, r, color: pg.draw.circle(surf, color, (cx, cy), r) and None,
+    "ring_spans": lambda surf, cx, cy, r, color: fill_ring(surf, cx, cy, r // 2, r, color),
+    "pg_draw_ring": lambda surf, cx, cy, r, color: pg.draw.circle(surf, color, (cx, cy), r, r - r // 2 + 1) and None,
+}
+
+def benchmark(radii, kernels=tuple(CIRCLE_KERNELS), trials=20, warmup=2):
+    rows = []
+    for r in radii:
+        surf = pg.Surface((2 * r + 1, 2 * r + 1), depth=32)
+        for name in kernels:
+            draw = CIRCLE_KERNELS[name]
+            # Exact count: distinct non-background pixels after one draw
+            surf.fill((0, 0, 0))
+            reported = draw(surf, r, r, r, (255, 255, 255))
+            pixels = int(np.count_nonzero(pg.surfarray.pixels2d(surf)))
+            if reported is not None and reported != pixels:
+                raise AssertionError(f"{name} r={r}: reported {reported} pixels, wrote {pixels}")
+
+            for _ in range(warmup):
+                draw(surf, r, r, r, (255, 255, 255))
+            samples = []
+            for _ in range(trials):
+                t0 = time.perf_counter_ns()
+                draw(surf, r, r, r, (255, 255, 255))
+                samples.append(time.perf_counter_ns() - t0)
+            median = float(np.median(samples))
+            rows.append({
+                "algorithm": name,
+                "radius": r,
+                "pixels": pixels,
+                "trials": trials,
+                "median_ms": median / 1e6,
+                "p95_ms": float(np.percentile(samples, 95)) / 1e6,
+                "p99_ms": float(np.percentile(samples, 99)) / 1e6,
+                "ns_per_pixel": median / pixels,
+            })
+            row = rows[-1]
+            print(f"{name:>14} r={r:<5} pixels={pixels:<7} median={row['median_ms']:.3f}ms "
+                  f"p95={row['p95_ms']:.3f}ms p99={row['p99_ms']:.3f}ms {row['ns_per_pixel']:.1f} ns/px")
+    return rows
+
+def benchmark_batch(counts, size=(1920, 1080), radii=(2, 4, 8, 16, 32, 64), trials=10, warmup=1, seed=0):
+    """Circles per second for draw_circles vs drawing one circle at a time.
+
+    Centers are spread over three times the viewport so many get culled.
+    """
+    rng = np.random.default_rng(seed)
+    surf = pg.Surface(size, depth=32)
+    w, h = size
+    single = {"loop_midpoint": draw_circle_midpoint, "loop_midpoint_vec": draw_circle_midpoint_vec}
+    rows = []
+    for n in counts:
+        centers = np.column_stack([rng.integers(-w, 2 * w, n), rng.integers(-h, 2 * h, n)])
+        rs = rng.choice(radii, n)
+        colors = rng.integers(0, 256, (n, 3))
+        kernels = {"batch": lambda: draw_circles(surf, centers, rs, colors)}
+        for name, draw in single.items():
+            items = list(zip(centers.tolist(), rs.tolist(), [tuple(c) for c in colors.tolist()]))
+            kernels[name] = lambda draw=draw, items=items: [draw(surf, x, y, r, c) for (x, y), r, c in items]
+        for name, run in kernels.items():
+            for _ in range(warmup):
+                run()
+            samples = []
+            for _ in range(trials):
+                t0 = time.perf_counter_ns()
+                run()
+                samples.append(time.perf_counter_ns() - t0)
+            median = float(np.median(samples))
+            rows.append({
+                "algorithm": name,
+                "circles": n,
+                "trials": trials,
+                "median_ms": median / 1e6,
+                "p95_ms": float(np.percentile(samples, 95)) / 1e6,
+                "p99_ms": float(np.percentile(samples, 99)) / 1e6,
+                "circles_per_sec": n / (median / 1e9),
+            })
+            row = rows[-1]
+            print(f"{name:>18} circles={n:<7} median={row['median_ms']:.3f}ms "
+                  f"p95={row['p95_ms']:.3f}ms {row['circles_per_sec']:.0f} circles/s")
+    return rows
+
+def write_csv(rows, path):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+# ------------------------------------------------------------
+# Screenshots: the event loop only copies the frame; PNG encoding
+# and disk I/O happen on a background thread fed by a bounded queue
+# ------------------------------------------------------------
+class ScreenshotWriter:
+    def __init__(self, maxsize=8):
+        self.jobs = queue.Queue(maxsize)
+        self.done = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, surf, fname, block=False):
+        """Queue a snapshot of surf; returns False if the queue is full and
+        block is False (block=True waits instead, so nothing is dropped)."""
+        try:
+            self.jobs.put((surf.copy(), fname), block=block)
+            return True
+        except queue.Full:
+            return False
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            snapshot, fname = job
+            try:
+                pg.image.save(snapshot, fname)
+                self.done.put((fname, None))
+            except (pg.error, OSError) as e:
+                self.done.put((fname, e))
+
+    def completed(self):
+        """(fname, error) for every write finished since the last call."""
+        finished = []
+        while True:
+            try:
+                finished.append(self.done.get_nowait())
+            except queue.Empty:
+                return finished
+
+    def close(self):
+        # Pending writes are flushed before the thread exits
+        self.jobs.put(None)
+        self.thread.join()
+
+BURST_FRAMES = 30
 
 def main():
     pg.init()
@@ -91,7 +535,14 @@ def main():
     center = None
     radius = 0
     dragging = False
-    results = None  # (r, t_mid, t_bre, n_mid, n_bre)
+    results = None  # (r, t_mid, t_bre, n_mid, n_bre, text cache hit rate)
+    vectorized = False  # V toggles the octant-mirroring surfarray path
+    writer = ScreenshotWriter()
+    toast = None        # (text, color, hide_at)
+    burst = []          # file names still to capture, one per frame
+    drag_pos = None     # newest mouse position this frame (motion is coalesced)
+    preview_rect = None # area the drag preview covers on screen
+    info_rect = None    # area of the "Center/Radius" line while dragging
 
     def reset():
         nonlocal center, radius, dragging, results
@@ -105,7 +556,12 @@ def main():
 
     running = True
     while running:
+        # Frames where only the drag preview moved are presented with
+        # pg.display.update(dirty) instead of a full flip
+        full_redraw = not dragging
         for event in pg.event.get():
+            if event.type != pg.MOUSEMOTION:
+                full_redraw = True
             if event.type == pg.QUIT:
                 running = False
             elif event.type == pg.KEYDOWN:
@@ -113,30 +569,30 @@ def main():
                     running = False
                 elif event.key == pg.K_SPACE:
                     reset()
+                elif event.key == pg.K_v:
+                    vectorized = not vectorized
                 elif event.key == pg.K_s:
-                    # Save screenshot
+                    # Save screenshot (written in the background)
                     ts = time.strftime("%Y%m%d-%H%M%S")
                     fname = f"circle_compare_{ts}.png"
-                    pg.image.save(screen, fname)
-                    # simple toast
-                    pg.draw.rect(screen, (255, 255, 255), (10, H-40, 320, 30))
-                    blit_text(screen, f"Saved: {fname}", (16, H-36), font, GREEN)
-                    pg.display.flip()
-                    # brief pause for visibility
-                    pg.time.delay(500)
+                    if not writer.submit(screen, fname):
+                        toast = ("Screenshot writer busy, try again", RED, time.monotonic() + 1.5)
+                elif event.key == pg.K_b and not burst:
+                    # Burst: the next BURST_FRAMES frames, none dropped
+                    ts = time.strftime("%Y%m%d-%H%M%S")
+                    burst = [f"circle_burst_{ts}_{i:03d}.png" for i in range(BURST_FRAMES)]
 
             elif event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
                 center = event.pos
                 radius = 0
                 dragging = True
+                results = None
+                drag_pos = event.pos
+                preview_rect = info_rect = None
                 screen.fill(BG)
             elif event.type == pg.MOUSEMOTION and dragging:
-                # preview circle (geometric)
-                screen.fill(BG)
-                mx, my = event.pos
-                radius = int(round(math.hypot(mx - center[0], my - center[1])))
-                # simple preview using pg.draw.circle for guide only
-                pg.draw.circle(screen, GRAY, center, radius, 1)
+                # only the latest position matters; drawn once after the loop
+                drag_pos = event.pos
             elif event.type == pg.MOUSEBUTTONUP and event.button == 1 and dragging:
                 dragging = False
                 if radius <= 0:
@@ -144,33 +600,53 @@ def main():
 
                 # Draw both algorithms on fresh buffer to compare
                 screen.fill(BG)
+                midpoint = draw_circle_midpoint_vec if vectorized else draw_circle_midpoint
+                bresenham = draw_circle_bresenham_vec if vectorized else draw_circle_bresenham
 
                 # Midpoint timing
                 t0 = time.perf_counter()
-                n_mid = draw_circle_midpoint(screen, center[0], center[1], radius, RED)
+                n_mid = midpoint(screen, center[0], center[1], radius, RED)
                 t_mid = (time.perf_counter() - t0) * 1000.0  # ms
 
                 # Bresenham timing
                 t0 = time.perf_counter()
-                n_bre = draw_circle_bresenham(screen, center[0], center[1], radius, BLUE)
+                n_bre = bresenham(screen, center[0], center[1], radius, BLUE)
                 t_bre = (time.perf_counter() - t0) * 1000.0  # ms
 
-                results = (radius, t_mid, t_bre, n_mid, n_bre)
+                # Hit rate is sampled here; results text is overdrawn every frame
+                results = (radius, t_mid, t_bre, n_mid, n_bre, text_cache.hit_rate())
 
-        # HUD
-        # Top header
-        blit_text(screen, "Midpoint (red) vs Bresenham (blue) — Click & drag to draw. SPACE: reset, S: save, ESC: quit",
-                  (12, 10), big_font, (15, 15, 15))
+        dirty = []
 
-        # Live preview overlay
-        if dragging and center is not None:
+        # Drag preview: erase the previous frame's preview, draw the new one
+        if dragging and drag_pos is not None:
             cx, cy = center
-            pg.draw.line(screen, (0, 0, 0), (cx, cy), pg.mouse.get_pos(), 1)
-            blit_text(screen, f"Center: {center}  Radius: {radius}", (12, 50), font)
+            mx, my = drag_pos
+            drag_pos = None
+            radius = int(round(math.hypot(mx - cx, my - cy)))
+            # Restore both areas the last frame drew into before drawing anything
+            # new, so the erase never cuts into the fresh circle
+            for rect in (preview_rect, info_rect):
+                if rect:
+                    screen.fill(BG, rect)
+                    dirty.append(rect)
+            # simple preview using pg.draw.circle for guide only
+            pg.draw.circle(screen, GRAY, center, radius, 1)
+            pg.draw.line(screen, (0, 0, 0), center, (mx, my), 1)
+            preview_rect = pg.Rect(cx - radius - 2, cy - radius - 2, 2 * radius + 5, 2 * radius + 5).clip(screen.get_rect())
+            dirty.append(preview_rect)
+            # Live preview overlay, drawn last so it sits on top of the guide
+            info_rect = blit_text(screen, f"Center: {center}  Radius: {radius}", (12, 50), font)
+            dirty.append(info_rect)
+
+        # HUD
+        # Top header
+        dirty.append(blit_text(screen, "Midpoint (red) vs Bresenham (blue) — Click & drag to draw. SPACE: reset, S: save, B: burst, ESC: quit",
+                               (12, 10), big_font, (15, 15, 15)))
 
         # Results after drawing
         if results:
-            r, t_mid, t_bre, n_mid, n_bre = results
+            r, t_mid, t_bre, n_mid, n_bre, text_rate = results
             y = 50
             blit_text(screen, f"Center: {center}  Radius: {r}", (12, y), font); y += 26
             blit_text(screen, f"Midpoint:   {t_mid:.3f} ms, pixels plotted: {n_mid}", (12, y), font, RED); y += 26
@@ -178,13 +654,55 @@ def main():
 
             # Simple comparison verdict
             faster = "Midpoint" if t_mid < t_bre else ("Bresenham" if t_bre < t_mid else "Tie")
-            blit_text(screen, f"Faster this run: {faster}", (12, y), font, GREEN)
+            blit_text(screen, f"Faster this run: {faster}", (12, y), font, GREEN); y += 26
+            mode = f"vectorized, offset cache hit rate {offset_cache.hit_rate():.0%}" if vectorized else "per-pixel"
+            blit_text(screen, f"Mode: {mode} (V to toggle)", (12, y), font); y += 26
+            blit_text(screen, f"Text cache hit rate: {text_rate:.0%}", (12, y), font)
+
+        # Toast for finished screenshot writes
+        for fname, error in writer.completed():
+            text, color = (f"Saved: {fname}", GREEN) if error is None else (f"Save failed: {error}", RED)
+            toast = (text, color, time.monotonic() + 1.5)
+        if toast:
+            dirty.append(pg.Rect(10, H-40, 420, 30))
+            text, color, hide_at = toast
+            if time.monotonic() < hide_at:
+                pg.draw.rect(screen, (255, 255, 255), (10, H-40, 420, 30))
+                blit_text(screen, text, (16, H-36), font, color)
+            else:
+                pg.draw.rect(screen, BG, (10, H-40, 420, 30))
+                toast = None
 
-        pg.display.flip()
+        if full_redraw:
+            pg.display.flip()
+        else:
+            pg.display.update(dirty)
+        if burst:
+            # Blocking put: if the writer falls behind, frames wait rather than drop
+            writer.submit(screen, burst.pop(0), block=True)
         clock.tick(120)
 
+    writer.close()
     pg.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Midpoint vs Bresenham circle drawing")
+    parser.add_argument("--bench", action="store_true", help="run the headless benchmark instead of the app")
+    parser.add_argument("--bench-batch", action="store_true", help="benchmark draw_circles against per-circle drawing")
+    parser.add_argument("--counts", nargs="+", type=int, default=[100, 1000, 10000], help="circles per --bench-batch run")
+    parser.add_argument("--radii", nargs="+", type=int, default=[2 ** i for i in range(13)])
+    parser.add_argument("--kernels", nargs="+", default=list(CIRCLE_KERNELS), choices=list(CIRCLE_KERNELS))
+    parser.add_argument("--trials", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--csv", default="circle_bench.csv", help="CSV summary written by --bench / --bench-batch")
+    args = parser.parse_args()
+    if args.bench or args.bench_batch:
+        if args.bench:
+            rows = benchmark(args.radii, args.kernels, args.trials, args.warmup)
+        else:
+            rows = benchmark_batch(args.counts, trials=args.trials, warmup=args.warmup)
+        if rows:
+            write_csv(rows, args.csv)
+    else:
+        main()
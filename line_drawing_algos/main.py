@@ -1,8 +1,229 @@
+import argparse
+import csv
+import functools
+import itertools
+import json
+import math
+import os
 import pygame as pg
 import time
+from collections import OrderedDict
+import numpy as np
 
 GAMERES = (GAMEWIDTH, GAMEHEIGHT) = (100, 100)
 
+# ---------------------------------------------
+# Helpers shared by the batch (NumPy) rasterizers
+# ---------------------------------------------
+def _split_segments(segments):
+    seg = np.asarray(segments, dtype=np.int64).reshape(-1, 4)
+    return seg[:, 0], seg[:, 1], seg[:, 2], seg[:, 3]
+
+def _offsets(counts):
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+def _length_buckets(counts):
+    # Group lines whose pixel counts share a power of two so that padding
+    # them into one 2D block wastes at most half of it.
+    if len(counts) == 0:
+        return []
+    order = np.argsort(counts, kind="stable")
+    exponent = np.frexp(counts[order])[1]
+    bounds = np.flatnonzero(np.diff(exponent)) + 1
+    return np.split(order, bounds)
+
+# The batch kernels allocate several int64/float64 arrays per pixel, so
+# callers rasterize at most this many pixels per kernel call
+PIXEL_BUDGET = 1 << 20
+
+def _pixel_slices(counts, budget=PIXEL_BUDGET):
+    """Split consecutive lines into slices of at most budget pixels each.
+
+    A single line longer than the budget gets a slice of its own.
+    """
+    ends = np.cumsum(counts)
+    start = 0
+    while start < len(ends):
+        base = ends[start - 1] if start else 0
+        stop = max(int(np.searchsorted(ends, base + budget, side="right")), start + 1)
+        yield slice(start, stop)
+        start = stop
+
+# -------------------------------------------
+# Clipping: only the visible part gets walked
+# -------------------------------------------
+def liang_barsky(x1, y1, x2, y2, xmin, ymin, xmax, ymax):
+    """Clip a segment to a rectangle; returns the visible (t0, t1) or None."""
+    t0, t1 = 0.0, 1.0
+    dx = x2 - x1
+    dy = y2 - y1
+    for p, q in ((-dx, x1 - xmin), (dx, xmax - x1), (-dy, y1 - ymin), (dy, ymax - y1)):
+        if p == 0:
+            if q < 0:
+                return None
+            continue
+        t = q / p
+        if p < 0:
+            if t > t1:
+                return None
+            t0 = max(t0, t)
+        else:
+            if t < t0:
+                return None
+            t1 = min(t1, t)
+    return t0, t1
+
+def dda_seek(x1, y1, xinc, yinc, k, chunk=1 << 16):
+    """Position of a DDA walk after k steps, with the same float rounding
+    as adding the increments one by one (x1 + k * xinc can differ on .5 ties).
+
+    The sum runs in chunks that carry the position forward, so memory stays
+    bounded however far the walk has to seek.
+    """
+    if k == 0:
+        return x1, y1
+    acc = np.empty((2, min(k, chunk) + 1))
+    acc[:, 0] = x1, y1
+    while k > 0:
+        n = min(k, chunk)
+        block = acc[:, :n + 1]
+        block[0, 1:] = xinc
+        block[1, 1:] = yinc
+        np.cumsum(block, axis=1, out=block)
+        acc[:, 0] = block[:, n]
+        k -= n
+    return float(acc[0, 0]), float(acc[1, 0])
+
+def dda_window(x1, y1, x2, y2, width, height):
+    """Step window (k0, k1) of a DDA walk that can land on the surface, or None.
+
+    Clips against the surface padded by a pixel, since pixels are rounded.
+    """
+    steps = max(abs(x2 - x1), abs(y2 - y1))
+    if steps == 0:
+        return (0, 0) if 0 <= x1 < width and 0 <= y1 < height else None
+    span = liang_barsky(x1, y1, x2, y2, -1, -1, width, height)
+    if span is None:
+        return None
+    return max(0, math.floor(span[0] * steps)), min(steps, math.ceil(span[1] * steps))
+
+def _axis_range(start, step, size):
+    # Offsets o with 0 <= start + step * o < size
+    if step > 0:
+        return -start, size - 1 - start
+    return start - (size - 1), start
+
+def bresenham_clip(x1, y1, x2, y2, width, height):
+    """Clip a Bresenham walk to a width x height surface, exactly.
+
+    Returns (x, y, err, steps): the first visible pixel, the error term the
+    unclipped walk has at that pixel, and how many more steps stay visible.
+    Returns None if no pixel of the line is on the surface.
+    """
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    if dx >= dy:
+        major, minor = dx, dy
+        (k_lo, k_hi), (m_lo, m_hi) = _axis_range(x1, sx, width), _axis_range(y1, sy, height)
+    else:
+        major, minor = dy, dx
+        (k_lo, k_hi), (m_lo, m_hi) = _axis_range(y1, sy, height), _axis_range(x1, sx, width)
+
+    k0, k1 = max(0, k_lo), min(major, k_hi)
+    m_lo, m_hi = max(0, m_lo), min(minor, m_hi)
+    if m_lo > m_hi:
+        return None
+    # The minor offset after k steps is ceil((2k * minor - major) / (2 * major)),
+    # which is monotonic in k, so its visible window maps back to a k window
+    if minor:
+        k0 = max(k0, (2 * m_lo - 1) * major // (2 * minor) + 1)
+        k1 = min(k1, (2 * m_hi + 1) * major // (2 * minor))
+    if k0 > k1:
+        return None
+
+    m = -((major - 2 * k0 * minor) // (2 * major)) if major else 0
+    if dx >= dy:
+        x, y = x1 + sx * k0, y1 + sy * m
+        err = dx - dy - dy * k0 + dx * m
+    else:
+        x, y = x1 + sx * m, y1 + sy * k0
+        err = dx - dy - dy * m + dx * k0
+    return x, y, err, k1 - k0
+
+def bresenham_window(x1, y1, x2, y2, width, height):
+    """Step window (k0, k1) of the visible part of a Bresenham walk, or None."""
+    span = bresenham_clip(x1, y1, x2, y2, width, height)
+    if span is None:
+        return None
+    x, y, _, steps = span
+    k0 = abs(x - x1) if abs(x2 - x1) >= abs(y2 - y1) else abs(y - y1)
+    return k0, k0 + steps
+
+def clip_windows(segments, algorithm, width, height):
+    """Visible step windows of an (N, 4) array of segments.
+
+    Returns (idx, k0, k1) for the segments with anything to draw. Segments
+    whose bounding box lies on the surface keep their whole walk; only the
+    others are clipped, one at a time.
+    """
+    x1, y1, x2, y2 = _split_segments(segments)
+    k0 = np.zeros(len(x1), dtype=np.int64)
+    k1 = np.maximum(np.abs(x2 - x1), np.abs(y2 - y1))
+    keep = ((np.minimum(x1, x2) >= 0) & (np.maximum(x1, x2) < width)
+            & (np.minimum(y1, y2) >= 0) & (np.maximum(y1, y2) < height))
+    clip = dda_window if algorithm == "DDA" else bresenham_window
+    for i in np.flatnonzero(~keep).tolist():
+        window = clip(int(x1[i]), int(y1[i]), int(x2[i]), int(y2[i]), width, height)
+        if window is not None:
+            keep[i] = True
+            k0[i], k1[i] = window
+    idx = np.flatnonzero(keep)
+    return idx, k0[idx], k1[idx]
+
+def blit_pixels(surface, xs, ys, color):
+    """Write all (xs, ys) pixels in one assignment into the locked surface.
+
+    color is an RGB tuple, or an array of mapped colors, one per pixel.
+    """
+    w, h = surface.get_size()
+    keep = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+    value = surface.map_rgb(color) if isinstance(color, tuple) else color[keep]
+    pixels = pg.surfarray.pixels2d(surface)
+    pixels[xs[keep], ys[keep]] = value
+    del pixels  # releases the surface lock
+
+# HUD strings are mostly static, so rendered text is reused across frames
+class TextCache:
+    """LRU cache of rendered text keyed on (font, text, color, antialias)."""
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+        self.hits = self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Drop-in for font.render that reuses earlier results"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def hit_rate(self):
+        """Fraction of render calls served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
 class App:
     def __init__(self):
         pg.init()
@@ -15,16 +236,31 @@ class App:
         self.running = True
         self.fps = 60
         self.font = pg.font.Font(None, 48)
+        self.text_cache = TextCache()
         self.points = []
-        self.lines = []
+        self.lines = LineStore()
         self.last_benchmark = None
-        
-    def draw(self, entities):
-        self.screen.fill((20, 20, 20))
-        
-        # Draw lines
-        for entity in entities:
-            entity.draw(self.screen)
+        self.bg_color = (20, 20, 20)
+        # Lines are rasterized once into this layer; each frame just blits it
+        self.line_layer = pg.Surface((self.width, self.height)).convert()
+        self.line_layer.fill(self.bg_color)
+
+    def add_lines(self, *lines):
+        # Line objects are only used to draw; the store keeps the data
+        for line in lines:
+            self.lines.append(line.x1, line.y1, line.x2, line.y2, line.color, line.algorithm)
+            line.draw(self.line_layer)
+
+    def clear_lines(self):
+        self.lines.clear()
+        self.line_layer.fill(self.bg_color)
+
+    def rebuild_layer(self):
+        self.line_layer.fill(self.bg_color)
+        self.lines.draw(self.line_layer)
+
+    def draw(self):
+        self.screen.blit(self.line_layer, (0, 0))
         
         # Draw current points
         for point in self.points:
@@ -34,11 +270,13 @@ class App:
         info = [
             "Click two points to draw lines",
             "RED = DDA | CYAN = Bresenham",
-            "Press C to clear | Press ESC to exit"
+            "Press C to clear | Press ESC to exit",
+            f"Render path: {Line.render_mode} (M to toggle)",
+            f"Text cache hit rate: {self.text_cache.hit_rate():.0%}"
         ]
         
         for i, text in enumerate(info):
-            surface = self.font.render(text, True, (255, 255, 255))
+            surface = self.text_cache.render(self.font, text, True, (255, 255, 255))
             self.screen.blit(surface, (20, 20 + i * 50))
         
         # Show benchmark results
@@ -55,7 +293,7 @@ class App:
             
             for i, text in enumerate(perf_info):
                 color = (255, 80, 80) if "DDA" in text else (80, 255, 255) if "Bresenham" in text else (80, 255, 80)
-                surface = self.font.render(text, True, color)
+                surface = self.text_cache.render(self.font, text, True, color)
                 self.screen.blit(surface, (20, self.height - 150 + i * 50))
         
         pg.display.flip()
@@ -68,8 +306,12 @@ class App:
                 if event.key == pg.K_ESCAPE:
                     self.running = False
                 elif event.key == pg.K_c:
-                    self.lines = []
+                    self.clear_lines()
                     self.last_benchmark = None
+                elif event.key == pg.K_m:
+                    modes = ["set_at", "surfarray", "runs"]
+                    Line.render_mode = modes[(modes.index(Line.render_mode) + 1) % len(modes)]
+                    self.rebuild_layer()
             elif event.type == pg.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     self.points.append(event.pos)
@@ -84,7 +326,7 @@ class App:
                         # Benchmark
                         self.last_benchmark = self.benchmark_lines(x1, y1, x2, y2)
                         
-                        self.lines.extend([dda_line, bresenham_line])
+                        self.add_lines(dda_line, bresenham_line)
                         self.points = []
     
     def benchmark_lines(self, x1, y1, x2, y2):
@@ -104,7 +346,8 @@ class App:
         
         return dda_time, bresenham_time, len(dda_points), len(bresenham_points)
     
-    def dda_algorithm(self, x1, y1, x2, y2):
+    @staticmethod
+    def dda_algorithm(x1, y1, x2, y2):
         points = []
         dx = x2 - x1
         dy = y2 - y1
@@ -124,7 +367,8 @@ class App:
         
         return points
     
-    def bresenham_algorithm(self, x1, y1, x2, y2):
+    @staticmethod
+    def bresenham_algorithm(x1, y1, x2, y2):
         points = []
         dx = abs(x2 - x1)
         dy = abs(y2 - y1)
@@ -147,14 +391,121 @@ class App:
                 y += sy
         
         return points
-            
+
+    @staticmethod
+    def bresenham_runs(x1, y1, x2, y2, k0=0, k1=None):
+        """Bresenham as run slices: yields ((x, y), length) for each run of
+        pixels sharing a row (x-major lines) or a column (y-major lines), in
+        line order. Run m ends at step floor((2m + 1) * major / (2 * minor)),
+        so the cost is one division per run instead of one test per pixel.
+        Only steps k0..k1 are covered (default: the whole line), so a window
+        from bresenham_window costs nothing for the clipped-away runs.
+        """
+        dx = abs(x2 - x1)
+        dy = abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        major, minor = max(dx, dy), min(dx, dy)
+        if k1 is None:
+            k1 = major
+
+        k = k0
+        m = -((major - 2 * k0 * minor) // (2 * major)) if major else 0
+        while k <= k1:
+            end = min(k1, (2 * m + 1) * major // (2 * minor)) if minor else k1
+            if dx >= dy:
+                yield (x1 + sx * k, y1 + sy * m), end - k + 1
+            else:
+                yield (x1 + sx * m, y1 + sy * k), end - k + 1
+            k = end + 1
+            m += 1
+
+    @staticmethod
+    def dda_batch(segments, window=None):
+        """Rasterize an (N, 4) array of x1, y1, x2, y2 endpoints with DDA.
+
+        Returns (xs, ys, offsets): line i covers xs[offsets[i]:offsets[i + 1]].
+        The pixels match dda_algorithm exactly, including its float
+        accumulation, so the increments are summed with a row-wise cumsum
+        over length buckets instead of a closed form. window=(k0, k1) limits
+        line i to steps k0[i]..k1[i], as returned by clip_windows.
+        """
+        x1, y1, x2, y2 = _split_segments(segments)
+        dx = x2 - x1
+        dy = y2 - y1
+        steps = np.maximum(np.abs(dx), np.abs(dy))
+
+        safe_steps = np.maximum(steps, 1)
+        xinc = dx / safe_steps
+        yinc = dy / safe_steps
+
+        x0 = x1.astype(np.float64)
+        y0 = y1.astype(np.float64)
+        if window is None:
+            counts = steps + 1
+        else:
+            k0, k1 = window
+            counts = k1 - k0 + 1
+            for i in np.flatnonzero(k0).tolist():
+                x0[i], y0[i] = dda_seek(x0[i], y0[i], xinc[i], yinc[i], int(k0[i]))
+        offsets = _offsets(counts)
+
+        xs = np.empty(offsets[-1], dtype=np.int64)
+        ys = np.empty(offsets[-1], dtype=np.int64)
+        for idx in _length_buckets(counts):
+            width = counts[idx].max()
+            mask = np.arange(width) < counts[idx][:, None]
+            rows, cols = np.nonzero(mask)
+            dest = offsets[idx][rows] + cols
+            for start, inc, out in ((x0, xinc, xs), (y0, yinc, ys)):
+                acc = np.empty((len(idx), width), dtype=np.float64)
+                acc[:, 0] = start[idx]
+                acc[:, 1:] = inc[idx][:, None]
+                np.cumsum(acc, axis=1, out=acc)
+                out[dest] = np.rint(acc[rows, cols])
+        return xs, ys, offsets
+
+    @staticmethod
+    def bresenham_batch(segments, window=None):
+        """Rasterize an (N, 4) array of x1, y1, x2, y2 endpoints with Bresenham.
+
+        Returns (xs, ys, offsets) in the same layout as dda_batch, window
+        included. The major axis advances every step and the minor offset
+        after k steps is ceil((2k * minor - major) / (2 * major)), which is
+        exactly where bresenham_algorithm's error term crosses over.
+        """
+        x1, y1, x2, y2 = _split_segments(segments)
+        dx = np.abs(x2 - x1)
+        dy = np.abs(y2 - y1)
+        sx = np.where(x1 < x2, 1, -1)
+        sy = np.where(y1 < y2, 1, -1)
+        major = np.maximum(dx, dy)
+        minor = np.minimum(dx, dy)
+        k0 = np.zeros_like(major) if window is None else window[0]
+        counts = major + 1 if window is None else window[1] - k0 + 1
+        offsets = _offsets(counts)
+
+        line = np.repeat(np.arange(len(counts)), counts)
+        k = np.arange(offsets[-1]) - offsets[:-1][line] + k0[line]
+        major_l = major[line]
+        m = -((major_l - 2 * k * minor[line]) // np.maximum(2 * major_l, 1))
+
+        x_major = (dx >= dy)[line]
+        xs = x1[line] + sx[line] * np.where(x_major, k, m)
+        ys = y1[line] + sy[line] * np.where(x_major, m, k)
+        return xs, ys, offsets
+
     def run(self):
         while self.running:
             self.handle_events()
-            self.draw(self.lines)
+            self.draw()
             self.clock.tick(self.fps)
 
 class Line:
+    # "set_at" plots pixel by pixel, "surfarray" writes each line in one go,
+    # "runs" fills Bresenham run slices (DDA lines fall back to set_at)
+    render_mode = "set_at"
+
     def __init__(self, x1, y1, x2, y2, color, algorithm="DDA"):
         self.x1 = x1
         self.y1 = y1
@@ -163,12 +514,41 @@ class Line:
         self.color = color
         self.algorithm = algorithm
         
-    def draw(self, screen):
-        if self.algorithm == "DDA":
+    def draw(self, screen, mode=None):
+        mode = mode or Line.render_mode
+        if mode == "surfarray":
+            self.draw_surfarray(screen)
+        elif self.algorithm == "DDA":
             self.draw_dda(screen)
+        elif mode == "runs":
+            self.draw_runs(screen)
         else:
             self.draw_bresenham(screen)
     
+    def draw_surfarray(self, screen):
+        segments = np.array([(self.x1, self.y1, self.x2, self.y2)])
+        idx, k0, k1 = clip_windows(segments, self.algorithm, *screen.get_size())
+        if len(idx) == 0:
+            return
+        batch = App.dda_batch if self.algorithm == "DDA" else App.bresenham_batch
+        xs, ys, _ = batch(segments, (k0, k1))
+        blit_pixels(screen, xs, ys, self.color)
+
+    def draw_runs(self, screen):
+        window = bresenham_window(self.x1, self.y1, self.x2, self.y2, *screen.get_size())
+        if window is None:
+            return
+        horizontal = abs(self.x2 - self.x1) >= abs(self.y2 - self.y1)
+        step = 1 if (self.x1 < self.x2 if horizontal else self.y1 < self.y2) else -1
+        for (x, y), length in App.bresenham_runs(self.x1, self.y1, self.x2, self.y2, *window):
+            # fill() clips the rect to the surface for us
+            if horizontal:
+                left = x if step > 0 else x - length + 1
+                screen.fill(self.color, (left, y, length, 1))
+            else:
+                top = y if step > 0 else y - length + 1
+                screen.fill(self.color, (x, top, 1, length))
+
     def draw_dda(self, screen):
         dx = self.x2 - self.x1
         dy = self.y2 - self.y1
@@ -179,12 +559,20 @@ class Line:
                 screen.set_at((int(self.x1), int(self.y1)), self.color)
             return
         
+        # Clip to the surface (padded by a pixel for rounding) so only the
+        # visible stretch of the line is walked
+        width, height = screen.get_size()
+        window = dda_window(self.x1, self.y1, self.x2, self.y2, width, height)
+        if window is None:
+            return
+        k0, k1 = window
+
         xinc = dx / steps
         yinc = dy / steps
-        x, y = self.x1, self.y1
+        x, y = dda_seek(self.x1, self.y1, xinc, yinc, k0)
         
-        for _ in range(steps + 1):
-            if 0 <= int(round(x)) < screen.get_width() and 0 <= int(round(y)) < screen.get_height():
+        for _ in range(k1 - k0 + 1):
+            if 0 <= int(round(x)) < width and 0 <= int(round(y)) < height:
                 screen.set_at((int(round(x)), int(round(y))), self.color)
             x += xinc
             y += yinc
@@ -195,16 +583,15 @@ class Line:
         dy = abs(y2 - y1)
         sx = 1 if x1 < x2 else -1
         sy = 1 if y1 < y2 else -1
-        err = dx - dy
-        
-        x, y = x1, y1
-        while True:
-            if 0 <= x < screen.get_width() and 0 <= y < screen.get_height():
-                screen.set_at((x, y), self.color)
-            
-            if x == x2 and y == y2:
-                break
-                
+
+        span = bresenham_clip(x1, y1, x2, y2, screen.get_width(), screen.get_height())
+        if span is None:
+            return
+        x, y, err, steps = span
+
+        for _ in range(steps + 1):
+            screen.set_at((x, y), self.color)
+
             e2 = 2 * err
             if e2 > -dy:
                 err -= dy
@@ -213,6 +600,303 @@ class Line:
                 err += dx
                 y += sy
 
+# ----------------------------------------------------------------
+# Compact line storage: one structured record per line instead of a
+# Line object with its own __dict__.
+# ----------------------------------------------------------------
+ALGORITHMS = ["DDA", "Bresenham"]
+
+class LineStore:
+    dtype = np.dtype([
+        ("x1", np.int32), ("y1", np.int32), ("x2", np.int32), ("y2", np.int32),
+        ("color", np.uint32),      # index into self.palette
+        ("algorithm", np.uint8),   # index into ALGORITHMS
+    ])
+
+    def __init__(self, capacity=1024):
+        self.data = np.empty(capacity, dtype=self.dtype)
+        self.size = 0
+        self.palette = []
+        self.color_ids = {}  # color -> index into self.palette
+
+    def __len__(self):
+        return self.size
+
+    def _color_id(self, color):
+        color = tuple(color)
+        color_id = self.color_ids.get(color)
+        if color_id is None:
+            color_id = self.color_ids[color] = len(self.palette)
+            self.palette.append(color)
+        return color_id
+
+    def _reserve(self, extra):
+        if self.size + extra > len(self.data):
+            grown = np.empty(max(2 * len(self.data), self.size + extra), dtype=self.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+
+    def append(self, x1, y1, x2, y2, color, algorithm="DDA"):
+        self.extend([(x1, y1, x2, y2)], color, algorithm)
+
+    def extend(self, segments, color, algorithm="DDA"):
+        """Append an (N, 4) array of endpoints sharing one color and algorithm."""
+        seg = np.asarray(segments, dtype=np.int32).reshape(-1, 4)
+        self._reserve(len(seg))
+        rows = self.data[self.size:self.size + len(seg)]
+        for i, name in enumerate(("x1", "y1", "x2", "y2")):
+            rows[name] = seg[:, i]
+        rows["color"] = self._color_id(color)
+        rows["algorithm"] = ALGORITHMS.index(algorithm)
+        self.size += len(seg)
+
+    def clear(self):
+        self.size = 0
+        self.palette = []
+        self.color_ids = {}
+
+    def batches(self, batch_size=65536):
+        """Yield views of consecutive records, at most batch_size at a time."""
+        for start in range(0, self.size, batch_size):
+            yield self.data[start:min(start + batch_size, self.size)]
+
+    @staticmethod
+    def segments(batch):
+        return np.column_stack([batch["x1"], batch["y1"], batch["x2"], batch["y2"]])
+
+    def _blit_batch(self, surface, batch):
+        # Clip every line first; hidden lines keep an empty k0..k1 window
+        width, height = surface.get_size()
+        segments = self.segments(batch)
+        k0 = np.zeros(len(batch), dtype=np.int64)
+        k1 = np.full(len(batch), -1, dtype=np.int64)
+        for alg_id, name in enumerate(ALGORITHMS):
+            idx = np.flatnonzero(batch["algorithm"] == alg_id)
+            visible, lo, hi = clip_windows(segments[idx], name, width, height)
+            k0[idx[visible]] = lo
+            k1[idx[visible]] = hi
+        # Consecutive runs of lines under PIXEL_BUDGET pixels, drawn in order
+        for part in _pixel_slices(k1 - k0 + 1):
+            self._blit_lines(surface, batch, segments, k0, k1, np.arange(part.start, part.stop))
+
+    def _blit_lines(self, surface, batch, segments, k0, k1, lines):
+        # One rasterization per algorithm, then a single write ordered by
+        # line index so overlapping lines keep their drawing order
+        xs, ys, ids = [], [], []
+        for alg_id, name in enumerate(ALGORITHMS):
+            idx = lines[(batch["algorithm"][lines] == alg_id) & (k1[lines] >= k0[lines])]
+            if len(idx) == 0:
+                continue
+            kernel = App.dda_batch if name == "DDA" else App.bresenham_batch
+            bx, by, offsets = kernel(segments[idx], (k0[idx], k1[idx]))
+            xs.append(bx)
+            ys.append(by)
+            ids.append(np.repeat(idx, np.diff(offsets)))
+        if not ids:
+            return
+        ids = np.concatenate(ids)
+        order = np.argsort(ids, kind="stable")
+        # Map only the colors this batch uses; the palette can be far larger
+        used, inverse = np.unique(batch["color"][ids[order]], return_inverse=True)
+        mapped = np.array([surface.map_rgb(self.palette[c]) for c in used.tolist()], dtype=np.uint32)
+        colors = mapped[inverse.ravel()]
+        blit_pixels(surface, np.concatenate(xs)[order], np.concatenate(ys)[order], colors)
+
+    def draw(self, surface, mode=None):
+        mode = mode or Line.render_mode
+        for batch in self.batches():
+            if mode == "surfarray":
+                self._blit_batch(surface, batch)
+            else:
+                for x1, y1, x2, y2, color_id, alg_id in batch.tolist():
+                    Line(x1, y1, x2, y2, self.palette[color_id], ALGORITHMS[alg_id]).draw(surface, mode)
+
+# ----------------------------------------------------------------
+# Headless benchmark: kernels take an (N, 4) array of endpoints and
+# return the number of pixels they produced.
+# ----------------------------------------------------------------
+BENCH_EXTENT = 4096
+
+@functools.lru_cache(maxsize=1)
+def _bench_surface():
+    return pg.Surface((BENCH_EXTENT, BENCH_EXTENT))
+
+def _render_kernel(algorithm, mode):
+    # Times Line.draw with the given render path against an off-screen surface
+    def kernel(segs):
+        surface = _bench_surface()
+        for x1, y1, x2, y2 in segs.tolist():
+            Line(x1, y1, x2, y2, (255, 255, 255), algorithm).draw(surface, mode)
+        return int((np.abs(segs[:, 2:] - segs[:, :2]).max(axis=1) + 1).sum())
+    return kernel
+
+LINE_KERNELS = {
+    "dda": lambda segs: sum(len(App.dda_algorithm(*s)) for s in segs.tolist()),
+    "bresenham": lambda segs: sum(len(App.bresenham_algorithm(*s)) for s in segs.tolist()),
+    "dda_batch": lambda segs: len(App.dda_batch(segs)[0]),
+    "bresenham_batch": lambda segs: len(App.bresenham_batch(segs)[0]),
+    "bresenham_runs": lambda segs: sum(n for s in segs.tolist() for _, n in App.bresenham_runs(*s)),
+    "dda_set_at": _render_kernel("DDA", "set_at"),
+    "bresenham_set_at": _render_kernel("Bresenham", "set_at"),
+    "dda_surfarray": _render_kernel("DDA", "surfarray"),
+    "bresenham_surfarray": _render_kernel("Bresenham", "surfarray"),
+    "bresenham_runs_fill": _render_kernel("Bresenham", "runs"),
+}
+
+def make_population(length, octant, count, rng, extent=BENCH_EXTENT):
+    """Random segments of a fixed length whose direction lies in one octant.
+
+    octant=None gives degenerate zero-length lines.
+    """
+    starts = rng.integers(0, extent, size=(count, 2))
+    if octant is None:
+        return np.hstack([starts, starts])
+    angles = (octant + rng.random(count)) * (np.pi / 4)
+    ends = starts + np.rint(np.column_stack([np.cos(angles), np.sin(angles)]) * length).astype(np.int64)
+    return np.hstack([starts, ends])
+
+def time_kernel(kernel, segments, warmup, trials):
+    for _ in range(warmup):
+        kernel(segments)
+    samples = []
+    pixels = 0
+    for _ in range(trials):
+        start = time.perf_counter()
+        pixels = kernel(segments)
+        samples.append(time.perf_counter() - start)
+    return np.array(samples), pixels
+
+def run_benchmark(kernels, lengths, count, warmup, trials, seed):
+    rng = np.random.default_rng(seed)
+    populations = [(0, None)] + [(length, octant) for length in lengths for octant in range(8)]
+    results = []
+    for length, octant in populations:
+        segments = make_population(length, octant, count, rng)
+        for name in kernels:
+            samples, pixels = time_kernel(LINE_KERNELS[name], segments, warmup, trials)
+            median = float(np.median(samples))
+            results.append({
+                "kernel": name,
+                "length": length,
+                "octant": "degenerate" if octant is None else octant,
+                "lines": count,
+                "pixels": pixels,
+                "trials": trials,
+                "median_ms": median * 1000,
+                "p95_ms": float(np.percentile(samples, 95)) * 1000,
+                "p99_ms": float(np.percentile(samples, 99)) * 1000,
+                "pixels_per_sec": pixels / median if median > 0 else float("inf"),
+            })
+            r = results[-1]
+            print(f"{name:>16} len={length:<5} octant={r['octant']!s:<10} "
+                  f"median={r['median_ms']:.3f}ms p95={r['p95_ms']:.3f}ms "
+                  f"p99={r['p99_ms']:.3f}ms {r['pixels_per_sec'] / 1e6:.2f} Mpx/s")
+    return results
+
+def write_results(results, json_path=None, csv_path=None):
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(results, f, indent=2)
+    if csv_path and results:
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(results[0]))
+            writer.writeheader()
+            writer.writerows(results)
+
+# ----------------------------------------------------------------
+# Streaming render: segments are read in fixed-size chunks and each
+# chunk is rasterized under PIXEL_BUDGET, so memory stays bounded however
+# large the input file is.
+# ----------------------------------------------------------------
+def _is_numeric_row(line):
+    try:
+        [float(value) for value in line.split(",")]
+    except ValueError:
+        return False
+    return True
+
+def read_segments_csv(path, chunk_size):
+    """Yield (n, 4) int64 arrays of x1, y1, x2, y2 rows from a CSV file.
+
+    Blank lines are skipped, and a first line that does not parse as
+    numbers (such as a quoted header) is treated as a header.
+    """
+    with open(path, newline="") as f:
+        lines = (line for line in f if line.strip())
+        first = next(lines, None)
+        pending = [first] if first is not None and _is_numeric_row(first) else []
+        while True:
+            rows = pending + list(itertools.islice(lines, chunk_size - len(pending)))
+            pending = []
+            if not rows:
+                return
+            try:
+                chunk = np.loadtxt(rows, delimiter=",", dtype=np.int64, ndmin=2)
+            except ValueError as e:
+                raise ValueError(f"{path}: {e}") from e
+            if chunk.shape[1] != 4:
+                raise ValueError(f"{path}: expected 4 columns (x1, y1, x2, y2), got {chunk.shape[1]}")
+            yield chunk
+
+def read_segments_binary(path, chunk_size):
+    """Yield (n, 4) int64 arrays from packed little-endian int32 records."""
+    size = os.path.getsize(path)
+    if size % 16:
+        raise ValueError(f"{path}: size {size} is not a multiple of 16 bytes (4 int32 per segment)")
+    with open(path, "rb") as f:
+        while True:
+            chunk = np.fromfile(f, dtype="<i4", count=chunk_size * 4)
+            if chunk.size == 0:
+                return
+            yield chunk.reshape(-1, 4).astype(np.int64)
+
+def iter_segments(path, chunk_size=65536):
+    if path.lower().endswith((".csv", ".txt")):
+        return read_segments_csv(path, chunk_size)
+    return read_segments_binary(path, chunk_size)
+
+def render_segments(chunks, size, algorithm="Bresenham", color=(255, 255, 255), bg_color=(20, 20, 20)):
+    """Rasterize every chunk into one off-screen surface and return it."""
+    surface = pg.Surface(size)
+    surface.fill(bg_color)
+    batch = App.dda_batch if algorithm == "DDA" else App.bresenham_batch
+    total = 0
+    for chunk in chunks:
+        idx, k0, k1 = clip_windows(chunk, algorithm, *size)
+        for part in _pixel_slices(k1 - k0 + 1):
+            xs, ys, _ = batch(chunk[idx[part]], (k0[part], k1[part]))
+            blit_pixels(surface, xs, ys, color)
+        total += len(chunk)
+    print(f"Rendered {total} lines")
+    return surface
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="DDA vs Bresenham line drawing")
+    parser.add_argument("--bench", action="store_true", help="run the headless benchmark instead of the app")
+    parser.add_argument("--kernels", nargs="+", default=list(LINE_KERNELS), choices=list(LINE_KERNELS))
+    parser.add_argument("--lengths", nargs="+", type=int, default=[1, 8, 64, 512])
+    parser.add_argument("--count", type=int, default=100, help="lines per population")
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--trials", type=int, default=15)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--csv", help="write results to this CSV file")
+    parser.add_argument("--render", metavar="INPUT",
+                        help="render segments from a .csv or packed int32 file off-screen instead of the app")
+    parser.add_argument("--out", default="lines.png", help="image written by --render")
+    parser.add_argument("--size", nargs=2, type=int, default=[1920, 1080], metavar=("W", "H"))
+    parser.add_argument("--algorithm", choices=["DDA", "Bresenham"], default="Bresenham")
+    parser.add_argument("--chunk-size", type=int, default=65536, help="segments read per chunk")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    app = App()
-    app.run()
+    args = parse_args()
+    if args.bench:
+        results = run_benchmark(args.kernels, args.lengths, args.count, args.warmup, args.trials, args.seed)
+        write_results(results, args.json, args.csv)
+    elif args.render:
+        surface = render_segments(iter_segments(args.render, args.chunk_size), tuple(args.size), args.algorithm)
+        pg.image.save(surface, args.out)
+    else:
+        app = App()
+        app.run()
@@ -1,6 +1,15 @@
 import pygame
+import numpy as np
+import os
 import sys
-from collections import deque
+import argparse
+import csv
+import json
+import re
+import tracemalloc
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 import time
 
 # Initialize Pygame
@@ -21,19 +30,56 @@ POINT_COLOR = (255, 255, 0)
 
 # Animation settings
 DELAY = 0.001  # Delay between filling each pixel (seconds)
+FRAME_BUDGET_MS = 8  # Time per frame spent on a fill in Budgeted mode
+FILL_MODES = ["Animated", "Budgeted", "Instant"]
+
+class TextCache:
+    """LRU cache of rendered text keyed on (font, text, color, antialias)."""
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+        self.hits = self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Drop-in for font.render that reuses earlier results"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def hit_rate(self):
+        """Fraction of render calls served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
 
 class PolygonFiller:
-    def __init__(self):
-        # Get the desktop screen dimensions before creating any display
-        infoObject = pygame.display.Info()
-        actual_width = infoObject.current_w
-        actual_height = infoObject.current_h
-        
-        print(f"Detected desktop resolution: {actual_width} x {actual_height}")  # Debug info
-        
-        # Create fullscreen display using SCALED mode for better compatibility
-        self.screen = pygame.display.set_mode((actual_width, actual_height), pygame.FULLSCREEN | pygame.SCALED)
-        pygame.display.set_caption("Polygon Fill Algorithms Visualizer")
+    def __init__(self, grid=None):
+        if grid is None:
+            # Get the desktop screen dimensions before creating any display
+            infoObject = pygame.display.Info()
+            actual_width = infoObject.current_w
+            actual_height = infoObject.current_h
+            
+            print(f"Detected desktop resolution: {actual_width} x {actual_height}")  # Debug info
+            
+            # Create fullscreen display using SCALED mode for better compatibility
+            self.screen = pygame.display.set_mode((actual_width, actual_height), pygame.FULLSCREEN | pygame.SCALED)
+            pygame.display.set_caption("Polygon Fill Algorithms Visualizer")
+            
+            print(f"Display created with: {actual_width} x {actual_height}")  # Debug info
+        else:
+            # Headless: a (columns, rows) grid with no display, for benchmarks
+            actual_width = grid[0] * GRID_SIZE
+            actual_height = grid[1] * GRID_SIZE
+            self.screen = None
         self.clock = pygame.time.Clock()
         
         # Update global dimensions
@@ -41,17 +87,31 @@ class PolygonFiller:
         SCREEN_WIDTH = actual_width
         SCREEN_HEIGHT = actual_height
         
-        print(f"Display created with: {SCREEN_WIDTH} x {SCREEN_HEIGHT}")  # Debug info
-        
         self.points = []  # User-defined polygon points
         self.polygon_closed = False
-        self.grid_points = set()  # Filled grid points
+        self.grid_points = None  # Filled grid cells, one uint8 per cell indexed [y, x]
+        self.grid_shm = None  # Shared memory behind grid_points, see share_grid()
+        self.cells_surface = None  # grid_points scaled to screen size, see draw_filled_cells()
+        self.cells_dirty = True
+        self.clear_grid()
         self.current_algorithm = None
         self.is_filling = False
         self.waiting_for_seed = False  # Waiting for user to click seed point
+        self.fill_steps = None  # Generator of spans for the running fill
+        self.fill_span = None  # Unfinished part of the current span
+        self.fill_mode = FILL_MODES[0]
+        self.fill_clock = 0.0
+        self.fill_credit = 0.0
         self.selected_algorithm = None  # Which algorithm is waiting for seed
+        self.mask = None  # Inside/outside grid mask, see inside_mask()
+        self.mask_key = None
+        self.points_version = 0  # Bumped by points_changed() on every edit of self.points
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self.text_cache = TextCache()  # UI text is the same almost every frame
+        self.grid_surface = None  # Pre-rendered background, see draw_grid()
+        self.grid_key = None
+        self.needs_redraw = True
         
     def grid_to_screen(self, x, y):
         """Convert grid coordinates to screen coordinates"""
@@ -62,11 +122,17 @@ class PolygonFiller:
         return x // GRID_SIZE, y // GRID_SIZE
     
     def draw_grid(self):
-        """Draw the grid"""
-        for x in range(0, SCREEN_WIDTH, GRID_SIZE):
-            pygame.draw.line(self.screen, GRID_COLOR, (x, 0), (x, SCREEN_HEIGHT))
-        for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
-            pygame.draw.line(self.screen, GRID_COLOR, (0, y), (SCREEN_WIDTH, y))
+        """Draw the background and grid, rendered once per resolution and GRID_SIZE"""
+        key = (SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE)
+        if self.grid_key != key:
+            self.grid_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            self.grid_surface.fill(BG_COLOR)
+            for x in range(0, SCREEN_WIDTH, GRID_SIZE):
+                pygame.draw.line(self.grid_surface, GRID_COLOR, (x, 0), (x, SCREEN_HEIGHT))
+            for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
+                pygame.draw.line(self.grid_surface, GRID_COLOR, (0, y), (SCREEN_WIDTH, y))
+            self.grid_key = key
+        self.screen.blit(self.grid_surface, (0, 0))
     
     def draw_polygon(self):
         """Draw the polygon edges"""
@@ -112,10 +178,21 @@ class PolygonFiller:
                              GRID_SIZE // 3)
     
     def draw_filled_cells(self):
-        """Draw all filled grid cells"""
-        for point in self.grid_points:
-            screen_x, screen_y = self.grid_to_screen(point[0], point[1])
-            pygame.draw.rect(self.screen, FILL_COLOR, (screen_x, screen_y, GRID_SIZE, GRID_SIZE))
+        """Draw all filled grid cells with a single scaled blit"""
+        if self.cells_dirty:
+            self.cells_surface = None
+            if self.grid_points.any():
+                # One palette pixel per cell, index 0 transparent, scaled up to the cell size
+                rows, cols = self.grid_points.shape
+                cells = pygame.Surface((cols, rows), depth=8)
+                cells.set_palette_at(1, FILL_COLOR)
+                cells.set_colorkey(0)
+                pygame.surfarray.blit_array(cells, self.grid_points.T)
+                self.cells_surface = pygame.transform.scale(cells, (cols * GRID_SIZE, rows * GRID_SIZE))
+            self.cells_dirty = False
+        
+        if self.cells_surface is not None:
+            self.screen.blit(self.cells_surface, (0, 0))
     
     def draw_ui(self):
         """Draw UI instructions"""
@@ -126,18 +203,20 @@ class PolygonFiller:
             "2: Flood Fill (4-connected)",
             "3: Flood Fill (8-connected)",
             "4: Boundary Fill",
+            f"M: Fill mode ({self.fill_mode})",
             "C: Clear",
-            "ESC: Exit"
+            "ESC: Stop fill / Exit",
+            f"Text cache hit rate: {self.text_cache.hit_rate():.0%}"
         ]
         
         y_offset = 10
         for instruction in instructions:
-            text = self.small_font.render(instruction, True, (255, 255, 255))
+            text = self.text_cache.render(self.small_font, instruction, True, (255, 255, 255))
             self.screen.blit(text, (10, y_offset))
             y_offset += 30
         
         if self.waiting_for_seed:
-            seed_text = self.font.render("Click inside polygon to start filling!", True, (255, 100, 100))
+            seed_text = self.text_cache.render(self.font, "Click inside polygon to start filling!", True, (255, 100, 100))
             text_rect = seed_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
             # Draw background for better visibility
             bg_rect = text_rect.inflate(20, 10)
@@ -146,23 +225,22 @@ class PolygonFiller:
             self.screen.blit(seed_text, text_rect)
         
         if self.current_algorithm:
-            algo_text = self.font.render(f"Algorithm: {self.current_algorithm}", True, (255, 255, 0))
+            algo_text = self.text_cache.render(self.font, f"Algorithm: {self.current_algorithm}", True, (255, 255, 0))
             self.screen.blit(algo_text, (SCREEN_WIDTH - 500, 10))
     
-    def scanline_fill(self):
-        """Scanline Fill Algorithm with animation"""
+    def scanline_spans(self):
+        """Yield (y, x_start, x_end) fill spans using an Active Edge Table"""
         if len(self.points) < 3:
             return
         
-        self.current_algorithm = "Scanline Fill"
-        self.grid_points.clear()
-        
         # Find min and max y coordinates
         min_y = min(p[1] for p in self.points)
         max_y = max(p[1] for p in self.points)
         
-        # Get polygon edges with proper vertex handling
-        edges = []
+        # Edge table: edges bucketed by their lower y. Each edge is
+        # [y_max, q, r, dq, dr, dy] with x = q + r / dy on the current
+        # scanline, stepped by divmod(dx, dy) so no scanline needs a division
+        edge_table = {}
         n = len(self.points)
         for i in range(n):
             p1 = self.points[i]
@@ -173,203 +251,255 @@ class PolygonFiller:
                 p1, p2 = p2, p1
             
             if p1[1] != p2[1]:  # Skip horizontal edges
-                edges.append((p1, p2))
+                dy = p2[1] - p1[1]
+                dq, dr = divmod(p2[0] - p1[0], dy)
+                edge_table.setdefault(p1[1], []).append([p2[1], p1[0], 0, dq, dr, dy])
         
-        # Process each scanline
+        active = []
         for y in range(min_y, max_y + 1):
-            intersections = []
+            active.extend(edge_table.get(y, ()))
             
-            # Find intersections with edges
-            for p1, p2 in edges:
-                # Check if scanline intersects this edge
-                # Use < for y_max to handle vertices correctly (except when it's the top vertex)
-                if p1[1] <= y < p2[1]:
-                    # Calculate x intersection
-                    if p2[1] != p1[1]:
-                        x = p1[0] + (y - p1[1]) * (p2[0] - p1[0]) / (p2[1] - p1[1])
-                        intersections.append(x)
-                elif y == p2[1] == max_y:  # Special case for topmost scanline
-                    if p1[1] <= y <= p2[1]:
-                        x = p1[0] + (y - p1[1]) * (p2[0] - p1[0]) / (p2[1] - p1[1])
-                        intersections.append(x)
+            # An edge covers p1.y <= y < p2.y so shared vertices count once,
+            # except on the topmost scanline, where edges ending there count
+            if y < max_y:
+                active = [edge for edge in active if edge[0] > y]
             
-            # Sort intersections and remove duplicates
-            intersections.sort()
+            # int() of each intersection; truncation keeps the sorted order
+            xs = sorted(q if q >= 0 or r == 0 else q + 1 for _, q, r, _, _, _ in active)
             
             # Fill between pairs of intersections
-            i = 0
-            while i < len(intersections) - 1:
-                x_start = int(intersections[i])
-                x_end = int(intersections[i + 1])
-                
-                for x in range(x_start, x_end + 1):
-                    self.grid_points.add((x, y))
-                    
-                    # Animation
-                    screen_x, screen_y = self.grid_to_screen(x, y)
-                    pygame.draw.rect(self.screen, FILL_COLOR, (screen_x, screen_y, GRID_SIZE, GRID_SIZE))
-                    pygame.display.flip()
-                    time.sleep(DELAY)
-                    
-                    # Check for exit events
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
-                            return
-                
-                i += 2
+            for i in range(0, len(xs) - 1, 2):
+                yield y, xs[i], xs[i + 1]
+            
+            # Step every active edge to the next scanline
+            for edge in active:
+                edge[1] += edge[3]
+                edge[2] += edge[4]
+                if edge[2] >= edge[5]:
+                    edge[1] += 1
+                    edge[2] -= edge[5]
     
-    def flood_fill_4(self, start_x, start_y):
-        """4-connected Flood Fill with animation"""
-        self.current_algorithm = "Flood Fill (4-connected)"
-        self.grid_points.clear()
-        
-        # Check if starting point is valid
-        if not self.is_inside_polygon(start_x, start_y):
+    def scanline_fill(self):
+        """Scanline Fill Algorithm, yields (y, x_start, x_end) spans clipped to the grid"""
+        if len(self.points) < 3:
             return
         
-        # Calculate grid boundaries
         max_grid_x = SCREEN_WIDTH // GRID_SIZE
         max_grid_y = SCREEN_HEIGHT // GRID_SIZE
         
-        queue = deque([(start_x, start_y)])
-        visited = set()
-        
-        while queue:
-            x, y = queue.popleft()
-            
-            if (x, y) in visited:
-                continue
-            
-            # Check bounds
-            if x < 0 or x >= max_grid_x or y < 0 or y >= max_grid_y:
-                continue
-            
-            if not self.is_inside_polygon(x, y):
-                continue
-            
-            visited.add((x, y))
-            self.grid_points.add((x, y))
-            
-            # Animation
-            screen_x, screen_y = self.grid_to_screen(x, y)
-            pygame.draw.rect(self.screen, FILL_COLOR, (screen_x, screen_y, GRID_SIZE, GRID_SIZE))
-            pygame.display.flip()
-            time.sleep(DELAY)
-            
-            # 4-connected neighbors
-            neighbors = [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
-            for nx, ny in neighbors:
-                if (nx, ny) not in visited:
-                    queue.append((nx, ny))
-            
-            # Check for exit events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
-                    return
+        for y, x_start, x_end in self.scanline_spans():
+            if 0 <= y < max_grid_y:
+                x_start, x_end = max(x_start, 0), min(x_end, max_grid_x - 1)
+                if x_start <= x_end:
+                    yield y, x_start, x_end
     
-    def flood_fill_8(self, start_x, start_y):
-        """8-connected Flood Fill with animation"""
-        self.current_algorithm = "Flood Fill (8-connected)"
-        self.grid_points.clear()
-        
-        if not self.is_inside_polygon(start_x, start_y):
+    def scanline_fill_parallel(self, workers=None, bands=None):
+        """Scanline Fill split into row bands, each filled by a worker process in shared memory"""
+        self.clear_grid()
+        rows, cols = self.grid_points.shape
+        if len(self.points) < 3 or rows * cols == 0:
             return
         
+        # Edges as (x_low, y_low, x_high, y_high) rows, horizontal ones dropped
+        p1 = np.array(self.points, dtype=np.int64)
+        p2 = np.roll(p1, -1, axis=0)
+        swap = (p1[:, 1] > p2[:, 1])[:, None]
+        edges = np.hstack((np.where(swap, p2, p1), np.where(swap, p1, p2)))
+        edges = edges[edges[:, 1] != edges[:, 3]]
+        max_y = int(p1[:, 1].max())
+        last = np.where(edges[:, 3] == max_y, max_y, edges[:, 3] - 1)
+        
+        # More bands than workers so uneven rows still balance out
+        workers = workers or os.cpu_count() or 1
+        bounds = np.linspace(0, rows, (bands or workers * 4) + 1).astype(int)
+        
+        # Workers write disjoint rows of the shared grid; only edges and band
+        # bounds are sent over, nothing comes back per cell
+        name = self.share_grid()
+        with ProcessPoolExecutor(workers) as pool:
+            futures = []
+            for y_start, y_end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+                crossing = (edges[:, 1] < y_end) & (last >= y_start)
+                if y_start < y_end and crossing.any():
+                    futures.append(pool.submit(fill_band, name, (rows, cols),
+                                               edges[crossing], y_start, y_end, max_y))
+            for future in futures:
+                future.result()
+        self.cells_dirty = True
+    
+    def span_fill(self, start_x, start_y, region, diagonal=False):
+        """Scanline seed fill of a grid bitmap, yields (y, x_start, x_end) spans"""
+        # region holds one byte per cell, row-major, nonzero where a cell may be
+        # filled. Whole horizontal runs are filled at once, with one seed pushed
+        # per run on the rows above and below. diagonal=True scans those rows
+        # one cell past each end of the run, giving 8-connectivity.
+        
         # Calculate grid boundaries
         max_grid_x = SCREEN_WIDTH // GRID_SIZE
         max_grid_y = SCREEN_HEIGHT // GRID_SIZE
         
-        queue = deque([(start_x, start_y)])
-        visited = set()
+        if start_x < 0 or start_x >= max_grid_x or start_y < 0 or start_y >= max_grid_y:
+            return
         
-        while queue:
-            x, y = queue.popleft()
-            
-            if (x, y) in visited:
-                continue
-            
-            # Check bounds
-            if x < 0 or x >= max_grid_x or y < 0 or y >= max_grid_y:
-                continue
+        # Cells still to fill; filled cells are cleared, so this is also the visited map
+        todo = bytearray(region)
+        if not todo[start_y * max_grid_x + start_x]:
+            return
+        
+        # Stack of (x_start, x_end, y) segments of cells still to fill
+        stack = [(start_x, start_x, start_y)]
+        
+        while stack:
+            left, right, y = stack.pop()
+            row = y * max_grid_x
             
-            if not self.is_inside_polygon(x, y):
+            # Runs are filled whole, so a filled cell means a filled segment
+            if not todo[row + left]:
                 continue
             
-            visited.add((x, y))
-            self.grid_points.add((x, y))
-            
-            # Animation
-            screen_x, screen_y = self.grid_to_screen(x, y)
-            pygame.draw.rect(self.screen, FILL_COLOR, (screen_x, screen_y, GRID_SIZE, GRID_SIZE))
-            pygame.display.flip()
-            time.sleep(DELAY)
-            
-            # 8-connected neighbors
-            neighbors = [
-                (x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1),
-                (x + 1, y + 1), (x + 1, y - 1), (x - 1, y + 1), (x - 1, y - 1)
-            ]
-            for nx, ny in neighbors:
-                if (nx, ny) not in visited:
-                    queue.append((nx, ny))
-            
-            # Check for exit events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
-                    return
+            # Extend the segment to the full run
+            edge = todo.rfind(0, row, row + left)
+            left = edge + 1 - row if edge >= 0 else 0
+            edge = todo.find(0, row + right + 1, row + max_grid_x)
+            right = edge - 1 - row if edge >= 0 else max_grid_x - 1
+            
+            todo[row + left:row + right + 1] = bytes(right - left + 1)
+            yield y, left, right
+            
+            # One seed segment per run of unfilled cells on the neighboring rows
+            lo = max(left - 1, 0) if diagonal else left
+            hi = min(right + 1, max_grid_x - 1) if diagonal else right
+            for ny in (y - 1, y + 1):
+                if ny < 0 or ny >= max_grid_y:
+                    continue
+                nrow = ny * max_grid_x
+                stop = nrow + hi + 1
+                seg_start = todo.find(1, nrow + lo, stop)
+                while seg_start >= 0:
+                    seg_end = todo.find(0, seg_start, stop)
+                    if seg_end < 0:
+                        seg_end = stop
+                    stack.append((seg_start - nrow, seg_end - 1 - nrow, ny))
+                    seg_start = todo.find(1, seg_end, stop)
     
-    def boundary_fill(self, start_x, start_y):
-        """Boundary Fill Algorithm with animation"""
-        self.current_algorithm = "Boundary Fill"
-        self.grid_points.clear()
+    def flood_fill_4(self, start_x, start_y):
+        """4-connected Flood Fill, yields filled spans"""
+        # Check if starting point is valid
+        if not self.is_inside_polygon(start_x, start_y):
+            return
         
+        yield from self.span_fill(start_x, start_y, self.inside_mask().tobytes())
+    
+    def flood_fill_8(self, start_x, start_y):
+        """8-connected Flood Fill, yields filled spans"""
+        if not self.is_inside_polygon(start_x, start_y):
+            return
+        
+        yield from self.span_fill(start_x, start_y, self.inside_mask().tobytes(), diagonal=True)
+    
+    def boundary_fill(self, start_x, start_y):
+        """Boundary Fill Algorithm, yields filled spans"""
         # Calculate grid boundaries
         max_grid_x = SCREEN_WIDTH // GRID_SIZE
         max_grid_y = SCREEN_HEIGHT // GRID_SIZE
         
-        # Get boundary points
-        boundary = set()
+        # Everything but the boundary cells may be filled
+        region = bytearray(b"\x01") * (max_grid_x * max_grid_y)
         n = len(self.points)
         for i in range(n):
             p1 = self.points[i]
             p2 = self.points[(i + 1) % n]
-            boundary.update(self.get_line_points(p1[0], p1[1], p2[0], p2[1]))
+            for x, y in self.get_line_points(p1[0], p1[1], p2[0], p2[1]):
+                if 0 <= x < max_grid_x and 0 <= y < max_grid_y:
+                    region[y * max_grid_x + x] = 0
         
         if not self.is_inside_polygon(start_x, start_y):
             return
         
-        queue = deque([(start_x, start_y)])
-        visited = set()
+        yield from self.span_fill(start_x, start_y, region)
+    
+    def clear_grid(self):
+        """Empty the filled-cell bitmap, resizing it if the grid dimensions changed"""
+        shape = (SCREEN_HEIGHT // GRID_SIZE, SCREEN_WIDTH // GRID_SIZE)
+        if self.grid_points is None or self.grid_points.shape != shape:
+            self.unshare_grid()
+            self.grid_points = np.zeros(shape, dtype=np.uint8)
+        else:
+            self.grid_points.fill(0)
+        self.cells_dirty = True
+    
+    def share_grid(self):
+        """Move grid_points into shared memory that worker processes can attach to, return its name"""
+        if self.grid_shm is None:
+            self.grid_shm = shared_memory.SharedMemory(create=True, size=max(self.grid_points.nbytes, 1))
+            grid = np.ndarray(self.grid_points.shape, dtype=np.uint8, buffer=self.grid_shm.buf)
+            grid[:] = self.grid_points
+            self.grid_points = grid
+        return self.grid_shm.name
+    
+    def unshare_grid(self):
+        """Copy grid_points back to private memory and free the shared segment"""
+        if self.grid_shm is None:
+            return
+        self.grid_points = self.grid_points.copy()
+        self.grid_shm.close()
+        self.grid_shm.unlink()
+        self.grid_shm = None
+    
+    def start_fill(self, name, spans):
+        """Begin a fill; the driver advances the span generator once per frame"""
+        self.current_algorithm = name
+        self.clear_grid()
+        self.fill_steps = spans
+        self.fill_span = None
+        self.is_filling = True
+        self.fill_clock = time.perf_counter()
+        self.fill_credit = 0.0
+    
+    def stop_fill(self):
+        """Abandon the running fill, keeping the cells filled so far"""
+        self.fill_steps = None
+        self.fill_span = None
+        self.is_filling = False
+    
+    def step_fill(self):
+        """Advance the running fill according to the selected driver mode"""
+        if not self.is_filling:
+            return
         
-        while queue:
-            x, y = queue.popleft()
-            
-            if (x, y) in visited or (x, y) in boundary:
-                continue
-            
-            # Check bounds
-            if x < 0 or x >= max_grid_x or y < 0 or y >= max_grid_y:
-                continue
-            
-            visited.add((x, y))
-            self.grid_points.add((x, y))
-            
-            # Animation
-            screen_x, screen_y = self.grid_to_screen(x, y)
-            pygame.draw.rect(self.screen, FILL_COLOR, (screen_x, screen_y, GRID_SIZE, GRID_SIZE))
-            pygame.display.flip()
-            time.sleep(DELAY)
-            
-            # 4-connected neighbors
-            neighbors = [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
-            for nx, ny in neighbors:
-                if (nx, ny) not in visited and (nx, ny) not in boundary:
-                    queue.append((nx, ny))
-            
-            # Check for exit events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+        now = time.perf_counter()
+        if self.fill_mode == "Instant":
+            # Run to completion, then draw once
+            budget, deadline = None, None
+        elif self.fill_mode == "Budgeted":
+            # As many steps as fit in FRAME_BUDGET_MS of this frame
+            budget, deadline = None, now + FRAME_BUDGET_MS / 1000
+        else:
+            # Cell-by-cell animation, one cell every DELAY seconds
+            self.fill_credit += (now - self.fill_clock) / DELAY
+            budget, deadline = max(1, int(self.fill_credit)), None
+            self.fill_credit -= budget
+        self.fill_clock = now
+        
+        cells = 0
+        while True:
+            # Spans are consumed in pieces so the animation can stop mid-span
+            if self.fill_span is None:
+                self.fill_span = next(self.fill_steps, None)
+                if self.fill_span is None:
+                    self.stop_fill()
                     return
+            y, x_start, x_end = self.fill_span
+            x_stop = x_end if budget is None else min(x_end, x_start + budget - cells - 1)
+            self.grid_points[y, x_start:x_stop + 1] = 1
+            self.cells_dirty = True
+            cells += x_stop - x_start + 1
+            self.fill_span = (y, x_stop + 1, x_end) if x_stop < x_end else None
+            
+            if budget is not None and cells >= budget:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
     
     def get_line_points(self, x0, y0, x1, y1):
         """Get all points on a line using Bresenham's algorithm"""
@@ -396,11 +526,58 @@ class PolygonFiller:
         
         return points
     
+    def build_inside_mask(self, width, height):
+        """Rasterize the polygon interior into a (height, width) boolean mask"""
+        if len(self.points) < 3:
+            return np.zeros((height, width), dtype=bool)
+        
+        # One (edge, row) pair per scanline each edge crosses, using the same
+        # half-open rule and intersection formula as the ray cast
+        p1 = np.array(self.points, dtype=np.int64)
+        p2 = np.roll(p1, -1, axis=0)
+        y_lo = np.clip(np.minimum(p1[:, 1], p2[:, 1]), 0, height)
+        y_hi = np.clip(np.maximum(p1[:, 1], p2[:, 1]), 0, height)
+        rows = np.maximum(y_hi - y_lo, 0)
+        edge = np.repeat(np.arange(len(p1)), rows)
+        y = np.arange(rows.sum()) - np.repeat(np.cumsum(rows) - rows, rows) + y_lo[edge]
+        x1, y1 = p1[edge, 0], p1[edge, 1]
+        x2, y2 = p2[edge, 0], p2[edge, 1]
+        x_intersect = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+        
+        # A cell at x lies left of every crossing with ceil(x_intersect) > x, so
+        # its crossing count is the row total minus the crossings at or before x.
+        # Only parity matters, which uint8 sums keep even when they wrap.
+        k = np.clip(np.ceil(x_intersect), 0, width).astype(np.int64)
+        keys, counts = np.unique(y * (width + 1) + k, return_counts=True)
+        toggles = np.zeros((height, width + 1), dtype=np.uint8)
+        toggles.flat[keys] = counts & 1
+        prefix = np.cumsum(toggles, axis=1, dtype=np.uint8)
+        return ((prefix[:, -1:] - prefix[:, :width]) & 1).astype(bool)
+    
+    def points_changed(self):
+        """Mark the polygon as edited so the next inside_mask() call rebuilds it"""
+        self.points_version += 1
+    
+    def inside_mask(self):
+        """Grid-sized inside/outside mask, rebuilt only when the polygon changes"""
+        width = SCREEN_WIDTH // GRID_SIZE
+        height = SCREEN_HEIGHT // GRID_SIZE
+        key = (self.points_version, width, height)
+        if key != self.mask_key:
+            self.mask = self.build_inside_mask(width, height)
+            self.mask_key = key
+        return self.mask
+    
     def is_inside_polygon(self, x, y):
-        """Check if a point is inside the polygon using ray casting"""
+        """Check if a point is inside the polygon"""
         if len(self.points) < 3:
             return False
         
+        mask = self.inside_mask()
+        if 0 <= y < mask.shape[0] and 0 <= x < mask.shape[1]:
+            return bool(mask[y, x])
+        
+        # Off the grid, fall back to ray casting
         count = 0
         n = len(self.points)
         
@@ -424,43 +601,77 @@ class PolygonFiller:
         cx = sum(p[0] for p in self.points) // len(self.points)
         cy = sum(p[1] for p in self.points) // len(self.points)
         
-        if self.is_inside_polygon(cx, cy):
+        # Look the candidates up in the mask, falling back for off-grid cells
+        mask = self.inside_mask()
+        height, width = mask.shape
+        def inside(x, y):
+            if 0 <= y < height and 0 <= x < width:
+                return mask[y, x]
+            return self.is_inside_polygon(x, y)
+        
+        if inside(cx, cy):
             return (cx, cy)
         
         # If centroid is outside, search nearby
         for dx in range(-5, 6):
             for dy in range(-5, 6):
-                if self.is_inside_polygon(cx + dx, cy + dy):
+                if inside(cx + dx, cy + dy):
                     return (cx + dx, cy + dy)
         
         return None
     
+    def load_polygon(self, path):
+        """Replace the polygon with one read from a file, scaled to fit the grid"""
+        self.stop_fill()
+        vertices, y_up = load_polygon_file(path)
+        self.points = fit_to_grid(vertices, SCREEN_WIDTH // GRID_SIZE, SCREEN_HEIGHT // GRID_SIZE, y_up)
+        self.points_changed()
+        self.polygon_closed = len(self.points) >= 3
+        self.current_algorithm = None
+        self.clear_grid()
+        self.inside_mask()
+        print(f"Loaded {len(self.points)} vertices from {path}")
+    
     def run(self):
         """Main game loop"""
         running = True
         
         while running:
             for event in pygame.event.get():
+                # Only pointer motion leaves the picture unchanged
+                if event.type != pygame.MOUSEMOTION:
+                    self.needs_redraw = True
+                
                 if event.type == pygame.QUIT:
                     running = False
                 
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
-                        running = False
+                        if self.is_filling:
+                            self.stop_fill()
+                        else:
+                            running = False
+                    
+                    elif event.key == pygame.K_m:
+                        index = FILL_MODES.index(self.fill_mode)
+                        self.fill_mode = FILL_MODES[(index + 1) % len(FILL_MODES)]
                     
                     elif event.key == pygame.K_RETURN and len(self.points) >= 3:
                         self.polygon_closed = True
+                        self.inside_mask()
                     
                     elif event.key == pygame.K_c:
+                        self.stop_fill()
                         self.points.clear()
-                        self.grid_points.clear()
+                        self.points_changed()
+                        self.clear_grid()
                         self.polygon_closed = False
                         self.current_algorithm = None
                         self.waiting_for_seed = False
                         self.selected_algorithm = None
                     
                     elif event.key == pygame.K_1 and self.polygon_closed:
-                        self.scanline_fill()
+                        self.start_fill("Scanline Fill", self.scanline_fill())
                     
                     elif event.key == pygame.K_2 and self.polygon_closed:
                         self.waiting_for_seed = True
@@ -484,11 +695,11 @@ class PolygonFiller:
                                 self.waiting_for_seed = False
                                 
                                 if self.selected_algorithm == "flood_4":
-                                    self.flood_fill_4(grid_x, grid_y)
+                                    self.start_fill("Flood Fill (4-connected)", self.flood_fill_4(grid_x, grid_y))
                                 elif self.selected_algorithm == "flood_8":
-                                    self.flood_fill_8(grid_x, grid_y)
+                                    self.start_fill("Flood Fill (8-connected)", self.flood_fill_8(grid_x, grid_y))
                                 elif self.selected_algorithm == "boundary":
-                                    self.boundary_fill(grid_x, grid_y)
+                                    self.start_fill("Boundary Fill", self.boundary_fill(grid_x, grid_y))
                                 
                                 self.selected_algorithm = None
                             else:
@@ -497,24 +708,284 @@ class PolygonFiller:
                         elif not self.polygon_closed:
                             # User is creating polygon
                             self.points.append((grid_x, grid_y))
+                            self.points_changed()
                     
                     elif event.button == 3 and len(self.points) >= 3:  # Right click
                         self.polygon_closed = True
-            
-            # Draw everything
-            self.screen.fill(BG_COLOR)
-            self.draw_grid()
-            self.draw_filled_cells()
-            self.draw_polygon()
-            self.draw_points()
-            self.draw_ui()
-            
-            pygame.display.flip()
+                        self.inside_mask()
+            
+            # Advance the running fill, if any
+            self.step_fill()
+            
+            # Draw everything, but only when something changed
+            if self.needs_redraw or self.cells_dirty:
+                self.draw_grid()
+                self.draw_filled_cells()
+                self.draw_polygon()
+                self.draw_points()
+                self.draw_ui()
+                
+                pygame.display.flip()
+                self.needs_redraw = False
             self.clock.tick(60)
         
+        self.unshare_grid()
         pygame.quit()
         sys.exit()
 
+# ----------------------------------------------------------------
+# Parallel scanline fill: each worker process rasterizes one band of
+# rows straight into a shared uint8 grid.
+# ----------------------------------------------------------------
+def fill_band(shm_name, shape, edges, y_start, y_end, max_y):
+    """Fill rows y_start..y_end - 1 of the shared grid, matching PolygonFiller.scanline_spans"""
+    rows, cols = shape
+    x_low, y_low, x_high, y_high = edges.T
+    
+    # Scanlines each edge covers inside the band: y_low <= y < y_high, plus
+    # y_high itself on the topmost scanline
+    last = np.where(y_high == max_y, max_y, y_high - 1)
+    first = np.maximum(y_low, y_start)
+    count = np.maximum(np.minimum(last, y_end - 1) - first + 1, 0)
+    edge = np.repeat(np.arange(len(edges)), count)
+    y = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count) + first[edge]
+    
+    # Exact intersection q + r / dy, truncated towards zero like the AET
+    dy = y_high[edge] - y_low[edge]
+    q, r = np.divmod((y - y_low[edge]) * (x_high[edge] - x_low[edge]), dy)
+    q += x_low[edge]
+    x = np.where((q >= 0) | (r == 0), q, q + 1)
+    
+    # Sort by row then x and pair up intersections within each row
+    order = np.lexsort((x, y))
+    x, y = x[order], y[order]
+    index = np.arange(len(y))
+    row_start = np.maximum.accumulate(np.where(np.r_[True, y[1:] != y[:-1]], index, 0))
+    even = (index - row_start) % 2 == 0
+    pair = np.flatnonzero(even[:-1] & (y[1:] == y[:-1]))
+    span_y = y[pair]
+    span_start = np.maximum(x[pair], 0)
+    span_end = np.minimum(x[pair + 1], cols - 1)
+    keep = span_start <= span_end
+    span_y, span_start, span_end = span_y[keep], span_start[keep], span_end[keep]
+    
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        grid = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        
+        # The grid was cleared beforehand, so only filled cells are written
+        for row, start, end in zip(span_y.tolist(), span_start.tolist(), span_end.tolist()):
+            grid[row, start:end + 1] = 1
+        del grid
+    finally:
+        shm.close()
+    return len(span_y)
+
+# ----------------------------------------------------------------
+# Polygon files: plain vertex lists, WKT and GeoJSON. The fills work on a
+# single ring, so only the exterior ring of the first polygon is used.
+# ----------------------------------------------------------------
+def parse_vertex(text):
+    """(x, y) of one "x y [z [m]]" or "x,y" vertex, or None if it is not all numbers"""
+    try:
+        values = [float(value) for value in text.replace(",", " ").split()]
+    except ValueError:
+        return None
+    return tuple(values[:2]) if len(values) >= 2 else None
+
+def parse_coordinates(vertices, path):
+    """Parse one vertex string per entry into an (n, 2) float array of x, y"""
+    points = []
+    for text in vertices:
+        point = parse_vertex(text)
+        if point is None:
+            raise ValueError(f"{path}: malformed vertex {text.strip()!r}")
+        points.append(point)
+    return np.array(points, dtype=np.float64).reshape(-1, 2)
+
+def read_vertex_list(path):
+    """Read one "x y" or "x,y" vertex per line; a non-numeric first line is a header"""
+    with open(path) as f:
+        lines = [line for line in f if line.strip()]
+    if lines and parse_vertex(lines[0]) is None:
+        lines = lines[1:]
+    return parse_coordinates(lines, path)
+
+def read_wkt(path):
+    """Read the exterior ring of a WKT POLYGON or MULTIPOLYGON"""
+    with open(path) as f:
+        rings = re.findall(r"\(([^()]*)\)", f.read())
+    if not rings:
+        raise ValueError(f"{path}: no WKT ring found")
+    if len(rings) > 1:
+        print(f"{path}: using the first of {len(rings)} rings")
+    # Vertices are comma separated; Z and M values after x y are dropped
+    return parse_coordinates(rings[0].split(","), path)
+
+def read_geojson(path):
+    """Read the exterior ring of the first Polygon or MultiPolygon in a GeoJSON file"""
+    with open(path) as f:
+        geometry = json.load(f)
+    while geometry.get("type") in ("FeatureCollection", "Feature", "GeometryCollection"):
+        if geometry["type"] == "FeatureCollection":
+            geometry = geometry["features"][0]
+        elif geometry["type"] == "Feature":
+            geometry = geometry["geometry"]
+        else:
+            geometry = geometry["geometries"][0]
+    if geometry["type"] == "Polygon":
+        ring = geometry["coordinates"][0]
+    elif geometry["type"] == "MultiPolygon":
+        ring = geometry["coordinates"][0][0]
+    else:
+        raise ValueError(f"{path}: unsupported geometry {geometry['type']}")
+    return np.array(ring, dtype=np.float64)[:, :2]
+
+def load_polygon_file(path):
+    """Read a polygon ring by file extension as (vertices, y_up), dropping the repeated closing vertex"""
+    lower = path.lower()
+    
+    # WKT and GeoJSON hold map coordinates with y growing upwards, vertex
+    # lists are already in the grid's y-down orientation
+    y_up = True
+    if lower.endswith(".wkt"):
+        vertices = read_wkt(path)
+    elif lower.endswith((".geojson", ".json")):
+        vertices = read_geojson(path)
+    else:
+        vertices = read_vertex_list(path)
+        y_up = False
+    if len(vertices) > 1 and (vertices[0] == vertices[-1]).all():
+        vertices = vertices[:-1]
+    return vertices, y_up
+
+def fit_to_grid(vertices, columns, rows, y_up=False):
+    """Scale vertices uniformly into a columns x rows grid, as integer (x, y) points"""
+    if len(vertices) == 0:
+        return []
+    low = vertices.min(axis=0)
+    extent = vertices.max(axis=0) - low
+    scale = min((columns - 1) / extent[0] if extent[0] else np.inf,
+                (rows - 1) / extent[1] if extent[1] else np.inf)
+    if not np.isfinite(scale):
+        scale = 1.0
+    cells = np.rint((vertices - low) * scale).astype(np.int64)
+    if y_up:
+        cells[:, 1] = rows - 1 - cells[:, 1]  # Keep y-up sources the right way up
+    
+    # Rounding merges nearby vertices; repeated ones only add empty edges
+    keep = (cells != np.roll(cells, 1, axis=0)).any(axis=1)
+    keep[0] = True
+    return [tuple(point) for point in cells[keep].tolist()]
+
+# ----------------------------------------------------------------
+# Headless fill benchmark
+# ----------------------------------------------------------------
+FILL_ALGORITHMS = {
+    "scanline": ("Scanline Fill", lambda filler, seed: filler.scanline_fill()),
+    "flood4": ("Flood Fill (4-connected)", lambda filler, seed: filler.flood_fill_4(*seed)),
+    "flood8": ("Flood Fill (8-connected)", lambda filler, seed: filler.flood_fill_8(*seed)),
+    "boundary": ("Boundary Fill", lambda filler, seed: filler.boundary_fill(*seed)),
+}
+BENCH_ALGORITHMS = list(FILL_ALGORITHMS) + ["parallel"]
+
+def run_fill(filler, name, seed, workers=None):
+    """Fill into filler.grid_points to completion from a cold inside mask, return the cell count"""
+    filler.mask_key = None
+    if name == "parallel":
+        filler.scanline_fill_parallel(workers)
+    else:
+        label, make_fill = FILL_ALGORITHMS[name]
+        filler.fill_mode = "Instant"
+        filler.start_fill(label, make_fill(filler, seed))
+        filler.step_fill()
+    return int(np.count_nonzero(filler.grid_points))
+
+def benchmark_fills(points, grid, algorithms, trials=3, workers=None):
+    """Time each fill headlessly on a (columns, rows) grid, print and return the results"""
+    filler = PolygonFiller(grid)
+    filler.points = points
+    filler.points_changed()
+    filler.polygon_closed = True
+    
+    # Seed fills start from the interior point, or any inside cell
+    seed = filler.get_interior_point()
+    if seed is None and filler.inside_mask().any():
+        y, x = np.unravel_index(np.argmax(filler.inside_mask()), filler.inside_mask().shape)
+        seed = (int(x), int(y))
+    
+    results = []
+    for name in algorithms:
+        if seed is None and name not in ("scanline", "parallel"):
+            print(f"{name:>9} skipped: no interior cell for a seed")
+            continue
+        samples = []
+        for _ in range(trials):
+            start = time.perf_counter()
+            cells = run_fill(filler, name, seed, workers)
+            samples.append(time.perf_counter() - start)
+        
+        # Peak memory comes from a separate run, tracemalloc slows the fill down
+        tracemalloc.start()
+        run_fill(filler, name, seed, workers)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        
+        wall = float(np.median(samples))
+        results.append({
+            "algorithm": name,
+            "columns": grid[0],
+            "rows": grid[1],
+            "vertices": len(points),
+            "cells": cells,
+            "trials": trials,
+            "wall_ms": wall * 1000,
+            "cells_per_sec": cells / wall if wall > 0 else float("inf"),
+            "peak_kib": peak / 1024,
+        })
+        r = results[-1]
+        print(f"{name:>9} cells={cells:<10} wall={r['wall_ms']:.1f}ms "
+              f"{r['cells_per_sec'] / 1e6:.2f} Mcells/s peak={r['peak_kib']:.0f} KiB")
+    filler.unshare_grid()
+    return results
+
+def write_results(results, json_path=None, csv_path=None):
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(results, f, indent=2)
+    if csv_path and results:
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(results[0]))
+            writer.writeheader()
+            writer.writerows(results)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Polygon fill algorithms visualizer")
+    parser.add_argument("--polygon", metavar="PATH",
+                        help="load a polygon from a vertex list, .wkt or .geojson file")
+    parser.add_argument("--bench", action="store_true", help="run the headless fill benchmark on --polygon")
+    parser.add_argument("--grid", nargs=2, type=int, default=[2000, 2000], metavar=("COLUMNS", "ROWS"),
+                        help="benchmark grid size in cells")
+    parser.add_argument("--algorithms", nargs="+", default=BENCH_ALGORITHMS, choices=BENCH_ALGORITHMS,
+                        help="fills to time; parallel is the multi-process banded scanline fill")
+    parser.add_argument("--workers", type=int, help="worker processes for parallel (default: all cores)")
+    parser.add_argument("--trials", type=int, default=3)
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--csv", help="write results to this CSV file")
+    args = parser.parse_args(argv)
+    if args.bench and not args.polygon:
+        parser.error("--bench needs --polygon")
+    return args
+
 if __name__ == "__main__":
-    app = PolygonFiller()
-    app.run()
\ No newline at end of file
+    args = parse_args()
+    if args.bench:
+        vertices, y_up = load_polygon_file(args.polygon)
+        points = fit_to_grid(vertices, *args.grid, y_up)
+        results = benchmark_fills(points, tuple(args.grid), args.algorithms, args.trials, args.workers)
+        write_results(results, args.json, args.csv)
+    else:
+        app = PolygonFiller()
+        if args.polygon:
+            app.load_polygon(args.polygon)
+        app.run()